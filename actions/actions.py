@@ -1,12 +1,15 @@
+import enum
+import functools
 import json
 import logging
 import os
-import random
 import re
-import string
+import secrets
+import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Text, Tuple
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple
 
 from rasa_sdk import Action, Tracker
 from rasa_sdk.events import SlotSet
@@ -57,7 +60,7 @@ SCALE_WORDS = {
     "thousand": 1000,
 }
 
-IGNORED_TOKENS = {
+IGNORED_TOKENS = frozenset({
     "and",
     "room",
     "rooms",
@@ -68,12 +71,106 @@ IGNORED_TOKENS = {
     "people",
     "persons",
     "person",
-}
+})
+
+# Replies to "is the information sufficient?" meaning continue / ask more
+YES_WORDS = frozenset({
+    "yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké",
+    "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore",
+    "no more", "no more questions",
+})
+
+NO_WORDS = frozenset({"no", "nope", "nee", "more", "else", "other", "another"})
+
+# Replies containing these are never "ask more" (e.g. "I don't need any more"); they wait for a clear answer
+NOT_NO_PHRASES = frozenset({"don't need", "dont need", "nothing else"})
+
+
+def _word_alternation(words: frozenset) -> str:
+    """Build a regex alternation of the phrases; longest phrases are tried first."""
+    alternatives = sorted(
+        (re.escape(word).replace(r"\ ", r"\s+") for word in words),
+        key=lambda alternative: (-len(alternative), alternative),
+    )
+    return "|".join(alternatives)
+
+
+# One whole-word pass classifies a reply; at each position yes-phrases are tried first,
+# so "no more" counts as yes and never as the no-word "no"
+REPLY_RE = re.compile(
+    r"\b(?:(?P<yes>%s)|(?P<no>%s))\b" % (_word_alternation(YES_WORDS), _word_alternation(NO_WORDS)),
+    re.IGNORECASE,
+)
+NOT_NO_RE = re.compile(r"\b(?:%s)\b" % _word_alternation(NOT_NO_PHRASES), re.IGNORECASE)
+
+
+class ReplyKind(enum.IntFlag):
+    """Reply categories found by REPLY_RE; member names match its group names."""
+    YES = 1
+    NO = 2
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_reply(text: str) -> ReplyKind:
+    """Return the mask of reply categories matched anywhere in the text."""
+    reply = ReplyKind(0)
+    for match in REPLY_RE.finditer(text):
+        reply |= ReplyKind[match.lastgroup.upper()]
+    if reply & ReplyKind.NO and NOT_NO_RE.search(text):
+        reply &= ~ReplyKind.NO
+    return reply
+
+# Canonical room_type slot values, interned so slot comparisons can hit the identity fast path
+ROOM_STANDARD = sys.intern("standard")
+ROOM_SUITE = sys.intern("suite")
+
+# Slot-value sentinels, interned for the same reason
+ASKED = sys.intern("asked")
+PAYMENT_AT_DESK = sys.intern("at_desk")
+PAYMENT_ONLINE = sys.intern("online")
+
+# Payment-option keywords, matched against whole tokens ("desktop"/"unknown" must not match)
+DESK_TOKENS = frozenset({"desk", "reception", "counter", "cash"})
+ONLINE_TOKENS = frozenset({"online", "now", "card", "credit", "debit"})
+TOKEN_RE = re.compile(r"[a-z]+")
+
+ROOM_PROMPT = "Which room would you like? (standard or suite)"
+CALENDAR_PROMPT = "Please select your arrival and departure date:"
+
+# Whole-word month names (full or abbreviated), e.g. to spot a date given as a number of nights
+MONTH_RE = re.compile(
+    r"\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?"
+    r"|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
+)
+
+# (timestamp, "YYYY-MM-DD") - today's date string, refreshed at most once a minute
+_today_cache: Tuple[float, str] = (0.0, "")
+
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, recomputed at most every 60 seconds."""
+    global _today_cache
+    now = time.time()
+    if now - _today_cache[0] > 60:
+        _today_cache = (now, datetime.now().strftime("%Y-%m-%d"))
+    return _today_cache[1]
+
+
+# Booking calendar payload as pre-serialized JSON; only the three dates vary
+CALENDAR_TEMPLATE = (
+    '{"type": "calendar", "mode": "booking", "message": "Please select your arrival and departure date", '
+    '"min_date": "%s", "arrival_date": %s, "departure_date": %s}'
+)
+
+
+def _calendar_payload(arrival: Optional[str] = None, departure: Optional[str] = None) -> str:
+    """Build the JSON payload for the booking calendar widget."""
+    # json.dumps only the slot values so they are quoted/escaped (or null)
+    return CALENDAR_TEMPLATE % (_today_str(), json.dumps(arrival), json.dumps(departure))
 
 
 def _generate_booking_reference(prefix: str = "SA-") -> str:
-    random_digits = "".join(random.choices(string.digits, k=6))
-    return f"{prefix}{random_digits}"
+    return f"{prefix}{secrets.randbelow(1_000_000):06d}"
 
 
 def _load_bookings() -> Dict[str, Dict[str, Any]]:
@@ -155,6 +252,19 @@ def _delete_booking(booking_reference: str) -> bool:
     return deleted
 
 
+# Plain (optionally signed/decimal) numbers such as "3" or "2.5", and the characters
+# stripped from a value before retrying it as a number
+PLAIN_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+NON_NUMERIC_RE = re.compile(r"[^0-9\.\-\s]")
+
+# Every number word mapped to (is_scale, value), so each token costs one dict lookup
+NUMBER_WORD_TABLE: Dict[str, Tuple[bool, int]] = {
+    **{word: (False, value) for word, value in NUM_WORDS.items()},
+    **{word: (False, value) for word, value in TENS_WORDS.items()},
+    **{word: (True, value) for word, value in SCALE_WORDS.items()},
+}
+
+
 def _parse_numeric_value(value: Any) -> Optional[float]:
     if value is None:
         return None
@@ -162,12 +272,27 @@ def _parse_numeric_value(value: Any) -> Optional[float]:
     if isinstance(value, (int, float)):
         return float(value)
 
-    text = str(value).strip().lower()
+    # Fast path for the common case of a plain digit string like "2" - this is also the
+    # form validated count slots are stored in (e.g. nights read back by the reservation hold)
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped.isdecimal():
+            return float(stripped)
+
+    return _parse_numeric_text(str(value).strip().lower())
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_numeric_text(text: str) -> Optional[float]:
+    """Cached string half of _parse_numeric_value; expects stripped, lowercased text."""
     if not text:
         return None
 
+    if PLAIN_NUMBER_RE.fullmatch(text):
+        return float(text)
+
     # remove commas and non numeric symbols except dot and minus
-    cleaned = re.sub(r"[^0-9\.\-\s]", "", text)
+    cleaned = NON_NUMERIC_RE.sub("", text)
     try:
         return float(cleaned)
     except ValueError:
@@ -181,69 +306,119 @@ def _parse_numeric_value(value: Any) -> Optional[float]:
     current = 0
 
     for token in tokens:
-        if token in NUM_WORDS:
-            current += NUM_WORDS[token]
-        elif token in TENS_WORDS:
-            current += TENS_WORDS[token]
-        elif token in SCALE_WORDS:
-            multiplier = SCALE_WORDS[token]
+        entry = NUMBER_WORD_TABLE.get(token)
+        if entry is None:
+            if token in IGNORED_TOKENS:
+                continue
+            return None
+        is_scale, value = entry
+        if is_scale:
             if current == 0:
                 current = 1
-            current *= multiplier
+            current *= value
             total += current
             current = 0
         else:
-            if token in IGNORED_TOKENS:
-                continue
-            return None
+            current += value
 
     return float(total + current)
 
 
+# Common date formats to try
+VALIDATE_DATE_FORMATS = (
+    "%d %B %Y",      # 15 February 2024
+    "%d %b %Y",      # 15 Feb 2024
+    "%d-%m-%Y",      # 15-02-2024
+    "%d/%m/%Y",      # 15/02/2024
+    "%Y-%m-%d",      # 2024-02-15
+    "%d.%m.%Y",      # 15.02.2024
+    "%B %d, %Y",     # February 15, 2024
+    "%b %d, %Y",     # Feb 15, 2024
+    "%d %B",         # 15 February (assume current year)
+    "%d %b",         # 15 Feb (assume current year)
+)
+
+# All-numeric date shapes and the single format each one can parse with
+NUMERIC_DATE_FORMATS = (
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{1,2}-\d{1,2}-\d{4}"), "%d-%m-%Y"),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), "%d/%m/%Y"),
+    (re.compile(r"\d{1,2}\.\d{1,2}\.\d{4}"), "%d.%m.%Y"),
+)
+
+# The calendar widget's YYYY-MM-DD dates; fromisoformat parses exactly this shape on every supported Python
+WIDGET_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+DIGIT_RE = re.compile(r"\d")
+MIN_DATE_LENGTH = len("1 May")
+
+
+def _parse_iso_date(date_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date/datetime as a naive datetime, or return None."""
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+    # Dates are compared against naive datetimes, so drop any UTC offset
+    return parsed.replace(tzinfo=None)
+
+
+@functools.lru_cache(maxsize=256)
+def _try_strptime(date_str: str, fmt: str) -> Optional[datetime]:
+    """strptime that returns None instead of raising; shared by the date validators."""
+    try:
+        return datetime.strptime(date_str, fmt)
+    except ValueError:
+        return None
+
+
 def _validate_date(date_str: str) -> tuple[bool, Optional[str]]:
     """Validate date string. Returns (is_valid, error_message or None)."""
     if not date_str or not date_str.strip():
         return False, None
     
     date_str = date_str.strip()
+    # Every accepted format carries a day number and is at least as long as "1 May",
+    # so anything else is rejected without touching strptime (or the cache)
+    if len(date_str) < MIN_DATE_LENGTH or not DIGIT_RE.search(date_str):
+        return False, "I couldn't understand that date format."
     
-    # Common date formats to try
-    formats = [
-        "%d %B %Y",      # 15 February 2024
-        "%d %b %Y",      # 15 Feb 2024
-        "%d-%m-%Y",      # 15-02-2024
-        "%d/%m/%Y",      # 15/02/2024
-        "%Y-%m-%d",      # 2024-02-15
-        "%d.%m.%Y",      # 15.02.2024
-        "%B %d, %Y",     # February 15, 2024
-        "%b %d, %Y",     # Feb 15, 2024
-        "%d %B",         # 15 February (assume current year)
-        "%d %b",         # 15 Feb (assume current year)
-    ]
+    return _validate_date_impl(date_str, datetime.now().toordinal())
+
+
+@functools.lru_cache(maxsize=2048)
+def _validate_date_impl(date_str: str, today_ordinal: int) -> Tuple[bool, Optional[str]]:
+    """Cached body of _validate_date. Keyed on today's ordinal so results expire at midnight."""
+    today = datetime.fromordinal(today_ordinal)
     
-    parsed_date = None
-    for fmt in formats:
-        try:
-            parsed_date = datetime.strptime(date_str, fmt)
+    # ISO dates (what the calendar widget sends) skip the format loop entirely
+    parsed_date = _parse_iso_date(date_str) if WIDGET_DATE_RE.fullmatch(date_str) else None
+    if parsed_date is None:
+        # Numeric dates can only match one format - skip straight to it
+        formats = VALIDATE_DATE_FORMATS
+        for pattern, fmt in NUMERIC_DATE_FORMATS:
+            if pattern.fullmatch(date_str):
+                formats = (fmt,)
+                break
+        
+        for fmt in formats:
+            parsed_date = _try_strptime(date_str, fmt)
+            if parsed_date is None:
+                continue
             # If format doesn't include year, assume current or next year
+            # (strptime defaults to 1900, so 29 February never gets this far)
             if "%Y" not in fmt:
-                now = datetime.now()
-                if parsed_date.replace(year=now.year) < now:
-                    parsed_date = parsed_date.replace(year=now.year + 1)
-                else:
-                    parsed_date = parsed_date.replace(year=now.year)
+                this_year = parsed_date.replace(year=today.year)
+                parsed_date = this_year if this_year >= today else parsed_date.replace(year=today.year + 1)
             break
-        except ValueError:
-            continue
     
     if parsed_date is None:
         return False, "I couldn't understand that date format."
     
     # Check if date is in the past (allow today)
-    now = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     check_date = parsed_date.replace(hour=0, minute=0, second=0, microsecond=0)
     
-    if check_date < now:
+    if check_date < today:
         return False, "That date is in the past. Please provide a future date."
     
     # Check for impossible dates (like 44 February)
@@ -264,44 +439,89 @@ def _validate_date(date_str: str) -> tuple[bool, Optional[str]]:
     return True, None
 
 
-def _validate_positive_number(value: Any, field_name: str = "number", allow_zero: bool = False) -> tuple[bool, Optional[str], Optional[float]]:
-    """Validate that a number is positive (and optionally non-zero). Returns (is_valid, error_message or None, parsed_value or None)."""
-    parsed = _parse_numeric_value(value)
-    
-    if parsed is None:
-        return False, f"I didn't understand that {field_name}. Please provide a number.", None
-    
-    if parsed < 0:
-        return False, f"{field_name.capitalize()} cannot be negative. Please provide a positive number.", None
-    
-    if not allow_zero and parsed == 0:
-        return False, f"{field_name.capitalize()} cannot be zero. Please provide a number greater than zero.", None
-    
-    return True, None, parsed
+# Full-date formats accepted when comparing arrival and departure dates
+DATE_FORMATS = ("%Y-%m-%d", "%d %B %Y", "%d %b %Y", "%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y", "%B %d, %Y", "%b %d, %Y")
 
 
-def _is_question(message: str) -> bool:
-    """Check if the message is a question."""
-    if not message:
+@functools.lru_cache(maxsize=512)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a full date string, trying ISO format first. Returns None if no format matches."""
+    parsed = _parse_iso_date(date_str) if WIDGET_DATE_RE.fullmatch(date_str) else None
+    if parsed is not None:
+        return parsed
+    for fmt in DATE_FORMATS:
+        parsed = _try_strptime(date_str, fmt)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_long(date: datetime) -> str:
+    """Format a date for user-facing messages, e.g. "05 January 2030"."""
+    return date.strftime("%d %B %Y")
+
+
+def _make_positive_validator(field_name: str, allow_zero: bool = False) -> Callable[[Any], Tuple[bool, Optional[str], Optional[float]]]:
+    """Build a positive-number validator for one field with its error messages pre-built.
+    The validator returns (is_valid, error_message or None, parsed_value or None)."""
+    not_understood_msg = f"I didn't understand that {field_name}. Please provide a number."
+    negative_msg = f"{field_name.capitalize()} cannot be negative. Please provide a positive number."
+    zero_msg = f"{field_name.capitalize()} cannot be zero. Please provide a number greater than zero."
+
+    def validate(value: Any) -> Tuple[bool, Optional[str], Optional[float]]:
+        parsed = _parse_numeric_value(value)
+        
+        if parsed is None:
+            return False, not_understood_msg, None
+        
+        if parsed < 0:
+            return False, negative_msg, None
+        
+        if not allow_zero and parsed == 0:
+            return False, zero_msg, None
+        
+        return True, None, parsed
+
+    return validate
+
+
+_validate_nights = _make_positive_validator("number of nights")
+_validate_rooms = _make_positive_validator("number of rooms")
+_validate_guests = _make_positive_validator("number of guests")
+
+
+# Substrings that mark a message as a question / facility / room / price enquiry
+QUESTION_WORDS = ("what", "which", "how", "when", "where", "why", "who", "tell me", "can you", "do you", "is there", "are there", "i don't know", "i dont know")
+ACCESSIBILITY_WORDS = ("disabled", "disability", "wheelchair", "mobility", "handicap", "accessible", "accessibility", "blind", "deaf", "hearing", "vision", "visual", "impairment")
+FACILITY_WORDS = ("pool", "swimming", "gym", "restaurant", "breakfast", "lunch", "dinner", "parking", "room", "rooms")
+ROOM_QUESTION_PHRASES = ("what type of rooms", "what rooms", "room types", "types of rooms", "difference", "differences", "what is the difference", "what are the", "tell me about")
+ROOM_QUESTION_WORDS = ("what", "which", "how", "tell me", "can you", "do you")
+PRICE_WORDS = ("price", "cost", "how much", "pricing", "rate", "rates")
+
+# The message classifiers are cached per process rather than on tracker.latest_message:
+# every validator runs as its own action-server request with a freshly built Tracker,
+# so only a module-level cache is shared across the validators of one turn
+@functools.lru_cache(maxsize=256)
+def _is_question(message_lower: str) -> bool:
+    """Check if the (already lowercased and stripped) message is a question."""
+    if not message_lower:
         return False
-    message_lower = message.lower().strip()
-    question_words = ["what", "which", "how", "when", "where", "why", "who", "tell me", "can you", "do you", "is there", "are there", "i don't know", "i dont know"]
-    return any(word in message_lower for word in question_words)
+    return any(word in message_lower for word in QUESTION_WORDS)
 
 
-def _is_facility_question(message: str) -> Tuple[bool, Optional[str]]:
-    """Check if the message is asking about facilities and return the response if it is."""
-    if not message:
+@functools.lru_cache(maxsize=256)
+def _is_facility_question(message_lower: str) -> Tuple[bool, Optional[str]]:
+    """Check if the (already lowercased and stripped) message is asking about facilities
+    and return the response if it is."""
+    if not message_lower:
         return False, None
     
-    message_lower = message.lower().strip()
-    
     # FIRST: Check for accessibility/disability questions combined with facilities
     # These need specific, helpful responses
-    accessibility_keywords = ["disabled", "disability", "wheelchair", "mobility", "handicap", "accessible", "accessibility", "blind", "deaf", "hearing", "vision", "visual", "impairment"]
-    facility_in_message = any(word in message_lower for word in ["pool", "swimming", "gym", "restaurant", "breakfast", "lunch", "dinner", "parking", "room", "rooms"])
+    facility_in_message = any(word in message_lower for word in FACILITY_WORDS)
     
-    if any(acc_word in message_lower for acc_word in accessibility_keywords):
+    if any(acc_word in message_lower for acc_word in ACCESSIBILITY_WORDS):
         if "pool" in message_lower or "swimming" in message_lower:
             return True, "Yes, absolutely! The pool is fully accessible for guests with disabilities. We have wheelchair access, pool lifts available, and our staff is trained to assist. The pool is open daily from 07:30 to 18:00. If you need any specific assistance or have questions about accessibility features, please let us know and we'll be happy to help."
         elif facility_in_message:
@@ -335,17 +555,15 @@ def _is_facility_question(message: str) -> Tuple[bool, Optional[str]]:
         return False, None
     
     # Check for room type questions
-    room_type_keywords = ["what type of rooms", "what rooms", "room types", "types of rooms", "difference", "differences", "what is the difference", "what are the", "tell me about"]
-    if any(keyword in message_lower for keyword in room_type_keywords):
+    if any(keyword in message_lower for keyword in ROOM_QUESTION_PHRASES):
         return True, room_summary
     
     # Also check if it contains "room" or "rooms" but only if it's clearly a question
-    if ("room" in message_lower or "rooms" in message_lower) and any(q_word in message_lower for q_word in ["what", "which", "how", "tell me", "can you", "do you"]):
+    if ("room" in message_lower or "rooms" in message_lower) and any(q_word in message_lower for q_word in ROOM_QUESTION_WORDS):
         return True, room_summary
     
     # Check for price/cost questions
-    price_keywords = ["price", "cost", "how much", "pricing", "rate", "rates"]
-    if any(keyword in message_lower for keyword in price_keywords):
+    if any(keyword in message_lower for keyword in PRICE_WORDS):
         return True, room_summary
     
     # Check for facility keywords
@@ -358,54 +576,65 @@ def _is_facility_question(message: str) -> Tuple[bool, Optional[str]]:
 
 def _ask_for_current_slot(tracker: Tracker, dispatcher: CollectingDispatcher, slot_name: str, domain: Dict[Text, Any] = None) -> None:
     """Ask for the current slot based on which slot is being collected."""
-    guests = tracker.get_slot("guests")
-    room_type = tracker.get_slot("room_type")
-    arrival_date = tracker.get_slot("arrival_date")
-    departure_date = tracker.get_slot("departure_date")
-    payment_option = tracker.get_slot("payment_option")
-    
     # Determine which slot we're currently collecting and ask for it
-    if slot_name == "guests" and not guests:
+    # Only the slot for the matching branch is read from the tracker
+    if slot_name == "guests" and not tracker.get_slot("guests"):
         dispatcher.utter_message(text="For how many guests?")
-    elif slot_name == "room_type" and not room_type:
-        dispatcher.utter_message(text="Which room would you like? (standard or suite)")
-    elif slot_name == "arrival_date" and not arrival_date:
-        # Show calendar widget - create calendar data directly to avoid circular import
-        try:
-            today = datetime.now()
-            calendar_data = {
-                "type": "calendar",
-                "mode": "booking",
-                "message": "Please select your arrival and departure date",
-                "min_date": today.strftime("%Y-%m-%d"),
-                "arrival_date": None,
-                "departure_date": None,
-            }
-            dispatcher.utter_message(text="Please select your arrival and departure date:")
-            dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-        except Exception as e:
-            dispatcher.utter_message(text="Please select your arrival and departure date:")
-    elif slot_name == "departure_date" and not departure_date:
-        # Show calendar widget - create calendar data directly to avoid circular import
-        try:
-            today = datetime.now()
-            arrival_date = tracker.get_slot("arrival_date")
-            calendar_data = {
-                "type": "calendar",
-                "mode": "booking",
-                "message": "Please select your arrival and departure date",
-                "min_date": today.strftime("%Y-%m-%d"),
-                "arrival_date": arrival_date if arrival_date else None,
-                "departure_date": None,
-            }
-            dispatcher.utter_message(text="Please select your arrival and departure date:")
-            dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-        except Exception as e:
-            dispatcher.utter_message(text="Please select your departure date:")
-    elif slot_name == "payment_option" and not payment_option:
+    elif slot_name == "room_type" and not tracker.get_slot("room_type"):
+        dispatcher.utter_message(text=ROOM_PROMPT)
+    elif slot_name == "arrival_date" and not tracker.get_slot("arrival_date"):
+        # Show calendar widget
+        dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
+    elif slot_name == "departure_date" and not tracker.get_slot("departure_date"):
+        # Show calendar widget
+        arrival_date = tracker.get_slot("arrival_date")
+        dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload(arrival_date or None))
+    elif slot_name == "payment_option" and not tracker.get_slot("payment_option"):
         dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
 
 
+def _handle_info_sufficient_response(
+    tracker: Tracker,
+    dispatcher: CollectingDispatcher,
+    latest_lower: Text,
+    yes_followup: Callable[[], List[Dict[Text, Any]]],
+    wait_for_answer: bool = True,
+) -> Optional[List[Dict[Text, Any]]]:
+    """Handle the reply to "is the information sufficient?" for a slot validator.
+
+    `latest_lower` is the latest user message, lowercased and stripped.
+    On "yes" the booking continues and `yes_followup` re-asks the slot, returning its
+    slot events. Returns None when the question is not pending, or when the reply is
+    unclear and `wait_for_answer` is False, so the caller carries on validating."""
+    if tracker.get_slot("information_sufficient") != ASKED:
+        return None
+    
+    reply = _classify_reply(latest_lower)
+    if reply & ReplyKind.YES:
+        dispatcher.utter_message(text="Great! Let's continue with your booking.")
+        return [SlotSet("information_sufficient", None)] + yes_followup()
+    elif reply & ReplyKind.NO:
+        dispatcher.utter_message(text="How can I assist you further?")
+        return [SlotSet("information_sufficient", None)]
+    
+    # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
+    # Return empty list to prevent Rasa from automatically continuing
+    return [] if wait_for_answer else None
+
+
+def _clear_slot(tracker: Tracker, slot_name: Text) -> List[Dict[Text, Any]]:
+    """Return the event clearing the slot, or no event if it is already empty."""
+    if tracker.get_slot(slot_name) is None:
+        return []
+    return [SlotSet(slot_name, None)]
+
+
+def _reask_arrival_date(dispatcher: CollectingDispatcher, tracker: Tracker) -> List[Dict[Text, Any]]:
+    """Show the booking calendar again and clear arrival_date to restart its collection."""
+    dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
+    return _clear_slot(tracker, "arrival_date")
+
+
 class ActionValidateDate(Action):
     """Validate arrival date and provide friendly error messages."""
     def name(self) -> Text:
@@ -441,128 +670,107 @@ class ActionValidateDate(Action):
                     )
                 )
             # Clear the slot to ask again (Rasa flow will handle this automatically)
-            return [SlotSet("arrival_date", None)]
+            return _clear_slot(tracker, "arrival_date")
         
         return []
 
 
-class ActionValidateNights(Action):
-    """Validate number of nights and provide friendly error messages."""
-    def name(self) -> Text:
-        return "action_validate_nights"
-    
-    def run(
-        self,
-        dispatcher: CollectingDispatcher,
-        tracker: Tracker,
-        domain: Dict[Text, Any],
-    ) -> List[Dict[Text, Any]]:
-        nights = tracker.get_slot("nights")
-        
-        if not nights:
-            return []
-        
-        # Check if the input looks like a date or month (common mistake)
-        nights_lower = str(nights).lower()
-        month_names = ["january", "february", "march", "april", "may", "june", 
-                      "july", "august", "september", "october", "november", "december",
-                      "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
-        
-        if any(month in nights_lower for month in month_names):
-            dispatcher.utter_message(
-                text=(
-                    "I think there might be some confusion. You mentioned a month, but I'm asking for the number of nights you'd like to stay. "
-                    "For example, if you want to stay for 3 nights, just say '3' or 'three nights'. "
-                    "Could you tell me how many nights you'd like to stay?"
-                )
-            )
-            return [SlotSet("nights", None)]
-        
-        is_valid, error_msg, parsed_value = _validate_positive_number(nights, "number of nights", allow_zero=False)
-        
-        if not is_valid:
-            dispatcher.utter_message(
-                text=(
-                    f"{error_msg} "
-                    "For example, you could say 'one night', 'two nights', or just '1' or '2'."
-                )
-            )
-            return [SlotSet("nights", None)]
-        
-        # Check for unreasonably high numbers
-        if parsed_value and parsed_value > 365:
-            dispatcher.utter_message(
-                text=(
-                    f"{int(parsed_value)} nights seems like a very long stay (more than a year). "
-                    "Could you please confirm the number of nights? For example, '3 nights' or '7 nights'."
-                )
-            )
-            return [SlotSet("nights", None)]
-        
-        return [SlotSet("nights", str(int(parsed_value)))]
+# Upper bound on remembered accepted values per count action before the memo is reset
+ACCEPTED_COUNT_CACHE_SIZE = 512
+
+
+def _make_count_validator(
+    class_name: str,
+    action_name: Text,
+    slot_name: Text,
+    validate: Callable[[Any], Tuple[bool, Optional[str], Optional[float]]],
+    unit: str,
+    empty_prompt: Optional[Text] = None,
+    too_large: Optional[Tuple[int, Text]] = None,
+    month_msg: Optional[Text] = None,
+) -> type:
+    """Build the Action class validating a positive count slot (nights, rooms, guests).
+
+    `unit` is the singular noun used in the examples; `empty_prompt` is asked when the slot
+    is empty. `too_large` is a (limit, message) pair rejecting counts above the limit, the
+    message formatted with `count`; `month_msg`, if given, rejects values mentioning a month."""
+    example_msg = f"For example, you could say 'one {unit}', 'two {unit}s', or just '1' or '2'."
+    # Slot value -> canonical count for values that passed every check. Accepting sends no
+    # message, so re-entry with an already-accepted value can skip straight to the SlotSet
+    accepted: Dict[str, str] = {}
+
+    # CRITICAL: rasa_sdk registers every Action subclass it finds, so each call builds a
+    # concrete class - a shared base class without name() would break action registration
+    class CountValidator(Action):
+        def name(self) -> Text:
+            return action_name
+
+        def run(
+            self,
+            dispatcher: CollectingDispatcher,
+            tracker: Tracker,
+            domain: Dict[Text, Any],
+        ) -> List[Dict[Text, Any]]:
+            value = tracker.get_slot(slot_name)
+
+            if not value:
+                # Only ask if information_sufficient is NOT "asked"
+                if empty_prompt and tracker.get_slot("information_sufficient") != ASKED:
+                    dispatcher.utter_message(text=empty_prompt)
+                return []
 
-
-class ActionValidateRooms(Action):
-    """Validate number of rooms and provide friendly error messages."""
-    def name(self) -> Text:
-        return "action_validate_rooms"
-    
-    def run(
-        self,
-        dispatcher: CollectingDispatcher,
-        tracker: Tracker,
-        domain: Dict[Text, Any],
-    ) -> List[Dict[Text, Any]]:
-        rooms = tracker.get_slot("rooms")
-        
-        if not rooms:
-            return []
-        
-        is_valid, error_msg, parsed_value = _validate_positive_number(rooms, "number of rooms", allow_zero=False)
-        
-        if not is_valid:
-            dispatcher.utter_message(
-                text=(
-                    f"{error_msg} "
-                    "For example, you could say 'one room', 'two rooms', or just '1' or '2'."
-                )
-            )
-            return [SlotSet("rooms", None)]
-        
-        return [SlotSet("rooms", str(int(parsed_value)))]
-
-
-class ActionValidateGuests(Action):
-    """Validate number of guests and provide friendly error messages."""
-    def name(self) -> Text:
-        return "action_validate_guests"
-    
-    def run(
-        self,
-        dispatcher: CollectingDispatcher,
-        tracker: Tracker,
-        domain: Dict[Text, Any],
-    ) -> List[Dict[Text, Any]]:
-        guests = tracker.get_slot("guests")
-        
-        if not guests:
-            # Only ask if information_sufficient is NOT "asked"
-            if information_sufficient != "asked":
-                dispatcher.utter_message(text="For how many guests?")
-            return []
-        
-        is_valid, error_msg, parsed_value = _validate_positive_number(guests, "number of guests", allow_zero=False)
-        
-        if not is_valid:
-            dispatcher.utter_message(
-                text=(
-                    f"{error_msg} "
-                    "For example, you could say 'one guest', 'two guests', or just '1' or '2'."
-                )
-            )
-            return [SlotSet("guests", None)]
-        
-        return [SlotSet("guests", str(int(parsed_value)))]
+            key = str(value)
+            canonical = accepted.get(key)
+            if canonical is not None:
+                return [SlotSet(slot_name, canonical)]
+
+            # Check if the input looks like a date or month (common mistake)
+            if month_msg and MONTH_RE.search(key.lower()):
+                dispatcher.utter_message(text=month_msg)
+                return _clear_slot(tracker, slot_name)
+
+            is_valid, error_msg, parsed_value = validate(value)
+
+            if not is_valid:
+                dispatcher.utter_message(text=f"{error_msg} {example_msg}")
+                return _clear_slot(tracker, slot_name)
+
+            # Check for unreasonably high numbers
+            if too_large is not None and parsed_value > too_large[0]:
+                dispatcher.utter_message(text=too_large[1].format(count=int(parsed_value)))
+                return _clear_slot(tracker, slot_name)
+
+            canonical = str(int(parsed_value))
+            if len(accepted) >= ACCEPTED_COUNT_CACHE_SIZE:
+                accepted.clear()
+            accepted[key] = canonical
+            return [SlotSet(slot_name, canonical)]
+
+    CountValidator.__name__ = CountValidator.__qualname__ = class_name
+    CountValidator.__doc__ = f"Validate {unit}s and provide friendly error messages."
+    return CountValidator
+
+
+ActionValidateNights = _make_count_validator(
+    "ActionValidateNights", "action_validate_nights", "nights", _validate_nights, "night",
+    too_large=(
+        365,
+        "{count} nights seems like a very long stay (more than a year). "
+        "Could you please confirm the number of nights? For example, '3 nights' or '7 nights'.",
+    ),
+    month_msg=(
+        "I think there might be some confusion. You mentioned a month, but I'm asking for the number of nights you'd like to stay. "
+        "For example, if you want to stay for 3 nights, just say '3' or 'three nights'. "
+        "Could you tell me how many nights you'd like to stay?"
+    ),
+)
+ActionValidateRooms = _make_count_validator(
+    "ActionValidateRooms", "action_validate_rooms", "rooms", _validate_rooms, "room",
+)
+ActionValidateGuests = _make_count_validator(
+    "ActionValidateGuests", "action_validate_guests", "guests", _validate_guests, "guest",
+    empty_prompt="For how many guests?",
+)
 
 
 class ActionConfirmReservationHold(Action):
@@ -603,7 +811,7 @@ class ActionSendPaymentLink(Action):
         tracker: Tracker,
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
-        reference_stub = "".join(random.choices(string.ascii_letters + string.digits, k=8))
+        reference_stub = secrets.token_hex(4)
         payment_url = f"https://stayassist.example/pay/{reference_stub}"
         dispatcher.utter_message(
             text=(
@@ -628,7 +836,7 @@ class ActionConfirmPaymentReceived(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         payment_option = tracker.get_slot("payment_option")
-        if payment_option == "online":
+        if payment_option == PAYMENT_ONLINE:
             dispatcher.utter_message(
                 text="Perfect! I have received your online payment."
             )
@@ -690,10 +898,10 @@ class ActionShowBookingSummary(Action):
         departure_formatted = departure_date if departure_date else "N/A"
         
         # Format room type
-        room_type_display = "Standard" if room_type == "standard" else "Suite" if room_type == "suite" else room_type or "N/A"
+        room_type_display = "Standard" if room_type == ROOM_STANDARD else "Suite" if room_type == ROOM_SUITE else room_type or "N/A"
         
         # Format payment option
-        payment_display = "Online" if payment_option == "online" else "At front desk" if payment_option == "at_desk" else payment_option or "N/A"
+        payment_display = "Online" if payment_option == PAYMENT_ONLINE else "At front desk" if payment_option == PAYMENT_AT_DESK else payment_option or "N/A"
         
         # Build summary message
         summary = f"""Here's your booking summary:
@@ -758,7 +966,8 @@ class ActionCancelBooking(Action):
             return [SlotSet("booking_reference", None), SlotSet("booking_number", None)]
         
         # Fallback to in-memory slot if not found in storage
-        stored = (tracker.get_slot("booking_reference") or "").strip().upper()
+        # (booking_reference is only ever set from generated references, so it is already canonical)
+        stored = tracker.get_slot("booking_reference") or ""
         if stored and provided == stored:
             _delete_booking(provided)  # Try to delete anyway
             dispatcher.utter_message(
@@ -799,7 +1008,7 @@ class ValidateChangeBookingNumber(Action):
         
         if not numbers_only:
             dispatcher.utter_message(text="Please provide your booking number using only numbers (no letters).")
-            return [SlotSet("change_booking_number", None)]
+            return _clear_slot(tracker, "change_booking_number")
         
         # Always set the cleaned number (only digits) - even if it matches, ensure it's clean
         if numbers_only != str(change_booking_number):
@@ -834,7 +1043,7 @@ class ValidateChangeBookingEmail(Action):
         email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         if not re.match(email_pattern, change_booking_email):
             dispatcher.utter_message(text="Please provide a valid email address.")
-            return [SlotSet("change_booking_email", None)]
+            return _clear_slot(tracker, "change_booking_email")
         
         return []
 
@@ -997,7 +1206,7 @@ class ActionChangeRoom(Action):
             logger.info(f"Booking {ref_to_use} room type updated from {old_room_type} to {room_type}")
         
         # Format room type
-        room_type_display = "Standard" if room_type == "standard" else "Suite" if room_type == "suite" else room_type.capitalize()
+        room_type_display = "Standard" if room_type == ROOM_STANDARD else "Suite" if room_type == ROOM_SUITE else room_type.capitalize()
         
         dispatcher.utter_message(
             text=(
@@ -1182,6 +1391,34 @@ class ActionChangeDate(Action):
         ]
 
 
+# facility_topic keywords in priority order (the first listed wins when several appear)
+FACILITY_TOPICS = ("pool", "parking", "breakfast", "lunch", "dinner", "gym", "suite", "standard", "room")
+FACILITY_TOPIC_RE = re.compile("|".join(FACILITY_TOPICS))
+
+ROOM_SUMMARY = (
+    "Standard rooms are €50 per night and suites are €120 per night. "
+    "Both offer king-size beds that can be converted into two singles on request, "
+    "plus a refrigerator, shower, and full bathroom; suites include a second WC."
+)
+FACILITY_INFO = {
+    "pool": "The pool is open daily from 07:30 to 18:00.",
+    "parking": "Parking is available for €5 per 24 hours.",
+    "breakfast": "Breakfast is served daily from 07:00 to 10:00.",
+    "lunch": "Lunch is available from 13:00 to 15:00.",
+    "dinner": "Dinner service runs from 18:00 to 20:00.",
+    "gym": "The gym is open 24 hours a day.",
+    "suite": ROOM_SUMMARY + " Suites also include extra living space for added comfort.",
+    "standard": ROOM_SUMMARY,
+    "room": ROOM_SUMMARY,
+}
+FACILITY_FALLBACK = (
+    "Here's a quick overview: "
+    f"{ROOM_SUMMARY} Pool 07:30-18:00, parking €5/24h, "
+    "breakfast 07:00-10:00, lunch 13:00-15:00, dinner 18:00-20:00, gym 24/7. "
+    "Let me know if you need details on anything else."
+)
+
+
 class ActionAnswerFacilityQuestion(Action):
     def name(self) -> Text:
         return "action_answer_facility_question"
@@ -1193,73 +1430,30 @@ class ActionAnswerFacilityQuestion(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         topic = (tracker.get_slot("facility_topic") or "").lower()
-        room_summary = (
-            "Standard rooms are €50 per night and suites are €120 per night. "
-            "Both offer king-size beds that can be converted into two singles on request, "
-            "plus a refrigerator, shower, and full bathroom; suites include a second WC."
-        )
-        info_map = {
-            "pool": "The pool is open daily from 07:30 to 18:00.",
-            "parking": "Parking is available for €5 per 24 hours.",
-            "breakfast": "Breakfast is served daily from 07:00 to 10:00.",
-            "lunch": "Lunch is available from 13:00 to 15:00.",
-            "dinner": "Dinner service runs from 18:00 to 20:00.",
-            "gym": "The gym is open 24 hours a day.",
-            "suite": room_summary + " Suites also include extra living space for added comfort.",
-            "standard": room_summary,
-            "room": room_summary,
-        }
-
-        response = None
-        for keyword, message in info_map.items():
-            if keyword in topic:
-                response = message
-                break
-
-        if response is None:
-            response = (
-                "Here's a quick overview: "
-                f"{room_summary} Pool 07:30-18:00, parking €5/24h, "
-                "breakfast 07:00-10:00, lunch 13:00-15:00, dinner 18:00-20:00, gym 24/7. "
-                "Let me know if you need details on anything else."
-            )
+        # One regex pass finds every keyword; the highest-priority one picks the answer
+        found = set(FACILITY_TOPIC_RE.findall(topic))
+        if found:
+            response = FACILITY_INFO[next(keyword for keyword in FACILITY_TOPICS if keyword in found)]
+        else:
+            response = FACILITY_FALLBACK
 
         dispatcher.utter_message(text=response)
         
-        # Check if we're in a booking flow - if so, continue with the next question
-        guests = tracker.get_slot("guests")
-        room_type = tracker.get_slot("room_type")
-        arrival_date = tracker.get_slot("arrival_date")
-        departure_date = tracker.get_slot("departure_date")
-        payment_option = tracker.get_slot("payment_option")
-        
         # If we're in a booking flow, continue with the next question directly
-        if guests is None:
+        # Slots are read lazily, so only those up to the first missing one are fetched
+        if tracker.get_slot("guests") is None:
             dispatcher.utter_message(text="For how many guests?")
             return []
-        elif room_type is None:
-            dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+        elif tracker.get_slot("room_type") is None:
+            dispatcher.utter_message(text=ROOM_PROMPT)
             return []
-        elif arrival_date is None:
-            try:
-                today = datetime.now()
-                calendar_data = {
-                    "type": "calendar",
-                    "mode": "booking",
-                    "message": "Please select your arrival and departure date",
-                    "min_date": today.strftime("%Y-%m-%d"),
-                    "arrival_date": None,
-                    "departure_date": None,
-                }
-                dispatcher.utter_message(text="Please select your arrival and departure date:")
-                dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-            except Exception:
-                dispatcher.utter_message(text="Please select your arrival and departure date:")
+        elif tracker.get_slot("arrival_date") is None:
+            dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
             return []
-        elif departure_date is None:
+        elif tracker.get_slot("departure_date") is None:
             dispatcher.utter_message(text="Please select your departure date:")
             return []
-        elif payment_option is None:
+        elif tracker.get_slot("payment_option") is None:
             dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
             return []
         
@@ -1280,7 +1474,7 @@ class ActionHandleContinueInterrupted(Action):
         # If information_sufficient is "asked", we've already asked the user if they want to continue
         # Don't show the default "Let's continue with book room" message
         information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
+        if information_sufficient == ASKED:
             # We've already asked the question, don't show anything
             return []
         
@@ -1308,49 +1502,30 @@ class ActionHandleContinue(Action):
         
         # CRITICAL: Check if information_sufficient is "asked" FIRST
         # This must happen BEFORE any other checks to prevent fallback
-        if information_sufficient == "asked":
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
+        if information_sufficient == ASKED:
+            reply = _classify_reply(latest_lower)
+            if reply & ReplyKind.YES:
                 # Determine which slot is currently being collected by checking which slots are None
                 # The order matters: guests -> room_type -> arrival_date -> departure_date -> payment_option
-                guests = tracker.get_slot("guests")
-                room_type = tracker.get_slot("room_type")
-                arrival_date = tracker.get_slot("arrival_date")
-                departure_date = tracker.get_slot("departure_date")
-                payment_option = tracker.get_slot("payment_option")
-                
                 dispatcher.utter_message(text="Great! Let's continue with your booking.")
                 
                 # Determine which slot we're waiting for based on flow order and respond directly
-                if not guests:
+                if not tracker.get_slot("guests"):
                     dispatcher.utter_message(text="For how many guests?")
                     return [SlotSet("guests", None), SlotSet("information_sufficient", None)]
-                elif not room_type:
-                    dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+                elif not tracker.get_slot("room_type"):
+                    dispatcher.utter_message(text=ROOM_PROMPT)
                     return [SlotSet("room_type", None), SlotSet("information_sufficient", None)]
-                elif not arrival_date:
-                    try:
-                        today = datetime.now()
-                        calendar_data = {
-                            "type": "calendar",
-                            "mode": "booking",
-                            "message": "Please select your arrival and departure date",
-                            "min_date": today.strftime("%Y-%m-%d"),
-                            "arrival_date": None,
-                            "departure_date": None,
-                        }
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
-                        dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                    except Exception:
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
+                elif not tracker.get_slot("arrival_date"):
+                    dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
                     return [SlotSet("arrival_date", None), SlotSet("information_sufficient", None)]
-                elif not departure_date:
+                elif not tracker.get_slot("departure_date"):
                     dispatcher.utter_message(text="Please select your departure date:")
                     return [SlotSet("departure_date", None), SlotSet("information_sufficient", None)]
-                elif not payment_option:
+                elif not tracker.get_slot("payment_option"):
                     dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
                     return [SlotSet("payment_option", None), SlotSet("information_sufficient", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
+            elif reply & ReplyKind.NO:
                 dispatcher.utter_message(text="How can I assist you further?")
                 return [SlotSet("information_sufficient", None)]
             # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet,
@@ -1378,45 +1553,26 @@ class ActionDefaultFallback(Action):
         latest_lower = latest_message.lower().strip() if latest_message else ""
         information_sufficient = tracker.get_slot("information_sufficient")
         
-        # CRITICAL: If information_sufficient == "asked" and user said "continue", handle it directly
-        if information_sufficient == "asked":
-            continue_words = ["continue", "yes", "ok", "okay", "proceed", "go ahead", "let's go", "lets go", "sure", "yeah", "yep", "ja", "jep", "oké", "doorgaan", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in continue_words):
+        # CRITICAL: If information_sufficient == ASKED and user said "continue", handle it directly
+        if information_sufficient == ASKED:
+            reply = _classify_reply(latest_lower)
+            if reply & ReplyKind.YES:
                 # Determine which slot is currently being collected
-                guests = tracker.get_slot("guests")
-                room_type = tracker.get_slot("room_type")
-                arrival_date = tracker.get_slot("arrival_date")
-                departure_date = tracker.get_slot("departure_date")
-                payment_option = tracker.get_slot("payment_option")
-                
                 dispatcher.utter_message(text="Great! Let's continue with your booking.")
                 
-                if not guests:
+                if not tracker.get_slot("guests"):
                     dispatcher.utter_message(text="For how many guests?")
                     return [SlotSet("information_sufficient", None), SlotSet("guests", None)]
-                elif not room_type:
-                    dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+                elif not tracker.get_slot("room_type"):
+                    dispatcher.utter_message(text=ROOM_PROMPT)
                     return [SlotSet("information_sufficient", None), SlotSet("room_type", None)]
-                elif not arrival_date:
-                    try:
-                        today = datetime.now()
-                        calendar_data = {
-                            "type": "calendar",
-                            "mode": "booking",
-                            "message": "Please select your arrival and departure date",
-                            "min_date": today.strftime("%Y-%m-%d"),
-                            "arrival_date": None,
-                            "departure_date": None,
-                        }
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
-                        dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                    except Exception:
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
+                elif not tracker.get_slot("arrival_date"):
+                    dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
                     return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-                elif not departure_date:
+                elif not tracker.get_slot("departure_date"):
                     dispatcher.utter_message(text="Please select your departure date:")
                     return [SlotSet("information_sufficient", None), SlotSet("departure_date", None)]
-                elif not payment_option:
+                elif not tracker.get_slot("payment_option"):
                     dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
                     return [SlotSet("information_sufficient", None), SlotSet("payment_option", None)]
         
@@ -1437,11 +1593,10 @@ class ActionClarifyExplanation(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         # Get the last bot message to provide a simpler version
-        last_bot_message = None
-        for event in reversed(tracker.events):
-            if event.get("event") == "bot" and event.get("text"):
-                last_bot_message = event.get("text")
-                break
+        last_bot_message = next(
+            (text for event in reversed(tracker.events) if event.get("event") == "bot" and (text := event.get("text"))),
+            None,
+        )
         
         if last_bot_message:
             dispatcher.utter_message(
@@ -1477,30 +1632,23 @@ class ValidateRoomType(Action):
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
         latest_lower = latest_message.lower().strip()
 
-        # Check if user is responding to "is information sufficient" question
-        information_sufficient = tracker.get_slot("information_sufficient")
         room_type = tracker.get_slot("room_type")
         
         # Handle special "__continue__" marker value set by slot mapping
         if room_type == "__continue__":
             dispatcher.utter_message(text="Great! Let's continue with your booking.")
-            dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+            dispatcher.utter_message(text=ROOM_PROMPT)
             return [SlotSet("information_sufficient", None), SlotSet("room_type", None)]
         
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Ask for room_type again - clear the slot to restart collection
-                dispatcher.utter_message(text="Which room would you like? (standard or suite)")
-                return [SlotSet("information_sufficient", None), SlotSet("room_type", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
-            # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
-            # Return empty list to prevent Rasa from automatically continuing
-            return []
+        def reask_room_type() -> List[Dict[Text, Any]]:
+            # CRITICAL: Ask for room_type again - clear the slot to restart collection
+            dispatcher.utter_message(text=ROOM_PROMPT)
+            return _clear_slot(tracker, "room_type")
+
+        # Check if user is responding to "is information sufficient" question
+        events = _handle_info_sufficient_response(tracker, dispatcher, latest_lower, reask_room_type)
+        if events is not None:
+            return events
 
         # FIRST: Check if the message is just a number (like "2", "3", etc.) - this is NOT a room type
         # Numbers are answers to "how many guests", not "which room type"
@@ -1508,7 +1656,7 @@ class ValidateRoomType(Action):
             # Try to parse as number
             float(latest_lower)
             # If it's just a number, clear the slot and return - this is not a room type
-            return [SlotSet("room_type", None)]
+            return _clear_slot(tracker, "room_type")
         except ValueError:
             # Not a pure number, continue
             pass
@@ -1518,13 +1666,12 @@ class ValidateRoomType(Action):
         # Accept "standard" even in longer messages (e.g., "I want standard", "standard please")
         if "standard" in latest_lower and "suite" not in latest_lower:
             # Selection like "standard", "standard room", "I want standard", etc.
-            return [SlotSet("room_type", "standard")]
+            return [SlotSet("room_type", ROOM_STANDARD)]
         elif "suite" in latest_lower:
             # Selection like "suite", "suite room", "I want suite", etc.
-            return [SlotSet("room_type", "suite")]
+            return [SlotSet("room_type", ROOM_SUITE)]
 
-        # Get the slot value (might be set by LLM mapping)
-        room_type = tracker.get_slot("room_type")
+        # The slot value might be set by LLM mapping
         if room_type:
             room_type_lower = str(room_type).lower().strip()
             # CRITICAL: If slot is "waiting", it means we're waiting for user to say "continue"
@@ -1532,46 +1679,46 @@ class ValidateRoomType(Action):
             # Check if slot value is just a number - if so, clear it
             try:
                 float(room_type_lower)
-                return [SlotSet("room_type", None)]
+                return _clear_slot(tracker, "room_type")
             except ValueError:
                 pass
             # Normalize room type
             if "standard" in room_type_lower:
-                return [SlotSet("room_type", "standard")]
+                return [SlotSet("room_type", ROOM_STANDARD)]
             elif "suite" in room_type_lower:
-                return [SlotSet("room_type", "suite")]
+                return [SlotSet("room_type", ROOM_SUITE)]
 
         # SECOND: Check if it's a facility question/statement (BEFORE checking if room_type is None)
         # This must happen for BOTH questions and statements (like "pool", "parking", etc.)
-        is_facility, facility_response = _is_facility_question(latest_message)
+        is_facility, facility_response = _is_facility_question(latest_lower)
         if is_facility and facility_response:
             dispatcher.utter_message(text=facility_response)
             # Continue with booking flow - ask for room type
-            dispatcher.utter_message(text="Which room would you like? (standard or suite)")
-            return [SlotSet("room_type", None)]
+            dispatcher.utter_message(text=ROOM_PROMPT)
+            return _clear_slot(tracker, "room_type")
         
         # THIRD: Check if it's a question (but not a facility question)
-        is_question = _is_question(latest_message)
+        is_question = _is_question(latest_lower)
         if is_question:
             # If it's a question but not a facility question, clear the slot
-            return [SlotSet("room_type", None)]
+            return _clear_slot(tracker, "room_type")
 
         # If no room_type slot and not a facility question, check one more time if message contains room type keywords
         if not room_type:
             # Last attempt: check if message contains room type keywords (case-insensitive, anywhere in message)
             if "standard" in latest_lower and "suite" not in latest_lower:
-                return [SlotSet("room_type", "standard")]
+                return [SlotSet("room_type", ROOM_STANDARD)]
             elif "suite" in latest_lower:
-                return [SlotSet("room_type", "suite")]
+                return [SlotSet("room_type", ROOM_SUITE)]
             else:
                 # Provide helpful guidance and ask again
                 dispatcher.utter_message(
                     text="I didn't understand that. Please choose either 'standard' or 'suite'."
                 )
                 dispatcher.utter_message(
-                    text="Which room would you like? (standard or suite)"
+                    text=ROOM_PROMPT
                 )
-                return [SlotSet("room_type", None)]
+                return _clear_slot(tracker, "room_type")
 
         return []
 
@@ -1587,33 +1734,15 @@ class ActionShowBookingCalendar(Action):
         tracker: Tracker,
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
-        try:
-            # First send the text message
-            dispatcher.utter_message(text="Please select your arrival and departure date:")
-            
-            # Then send the calendar widget separately
-            today = datetime.now()
-            arrival_date = tracker.get_slot("arrival_date")
-            departure_date = tracker.get_slot("departure_date")
-            
-            calendar_data = {
-                "type": "calendar",
-                "mode": "booking",  # Special mode for booking with both dates
-                "message": "Please select your arrival and departure date",
-                "min_date": today.strftime("%Y-%m-%d"),
-                "arrival_date": arrival_date if arrival_date else None,
-                "departure_date": departure_date if departure_date else None,
-            }
-            
-            dispatcher.utter_message(
-                text="",
-                custom=json.dumps(calendar_data)
-            )
-            return []
-        except Exception as e:
-            # Fallback: just send the text message if there's an error
-            dispatcher.utter_message(text="Please select your arrival and departure date:")
-            return []
+        arrival_date = tracker.get_slot("arrival_date")
+        departure_date = tracker.get_slot("departure_date")
+        
+        # Send the prompt and the calendar widget in a single message
+        dispatcher.utter_message(
+            text=CALENDAR_PROMPT,
+            custom=_calendar_payload(arrival_date or None, departure_date or None)
+        )
+        return []
 
 
 class ValidateArrivalDate(Action):
@@ -1628,93 +1757,44 @@ class ValidateArrivalDate(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
-        
+        latest_lower = latest_message.lower().strip()
+
+        # Check if user is responding to "is information sufficient" question
+        # CRITICAL: On "yes", show calendar widget again for arrival_date - clear the slot to restart collection
+        events = _handle_info_sufficient_response(
+            tracker, dispatcher, latest_lower, lambda: _reask_arrival_date(dispatcher, tracker), wait_for_answer=False
+        )
+        if events is not None:
+            return events
+
         # Check if it's a facility question/statement (BEFORE other checks)
         # This must happen for BOTH questions and statements (like "pool", "parking", etc.)
-        is_facility, facility_response = _is_facility_question(latest_message)
+        is_facility, facility_response = _is_facility_question(latest_lower)
         if is_facility and facility_response:
             dispatcher.utter_message(text=facility_response)
             # Continue with booking flow - show calendar
-            try:
-                today = datetime.now()
-                calendar_data = {
-                    "type": "calendar",
-                    "mode": "booking",
-                    "message": "Please select your arrival and departure date",
-                    "min_date": today.strftime("%Y-%m-%d"),
-                    "arrival_date": None,
-                    "departure_date": None,
-                }
-                dispatcher.utter_message(text="Please select your arrival and departure date:")
-                dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-            except Exception:
-                dispatcher.utter_message(text="Please select your arrival and departure date:")
-            return [SlotSet("arrival_date", None)]
-        
-        is_question = _is_question(latest_message)
+            return _reask_arrival_date(dispatcher, tracker)
 
-        # Check if user is responding to "is information sufficient" question
-        information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Show calendar widget again for arrival_date - clear the slot to restart collection
-                try:
-                    today = datetime.now()
-                    calendar_data = {
-                        "type": "calendar",
-                        "mode": "booking",
-                        "message": "Please select your arrival and departure date",
-                        "min_date": today.strftime("%Y-%m-%d"),
-                        "arrival_date": None,
-                        "departure_date": None,
-                    }
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                    dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                except Exception as e:
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
-            # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
-            # Return empty list to prevent Rasa from automatically continuing
+        # Still waiting for a yes/no to "is the information sufficient?"
+        if tracker.get_slot("information_sufficient") == ASKED:
             return []
 
-        if is_question or (is_facility and facility_response):
-            if is_facility and facility_response:
-                dispatcher.utter_message(text=facility_response)
-                # Continue with booking flow - ask for departure date if arrival_date is set
-                arrival_date = tracker.get_slot("arrival_date")
-                if arrival_date:
-                    dispatcher.utter_message(text="Please select your departure date:")
-                return [SlotSet("arrival_date", None)]
-            return [SlotSet("arrival_date", None)]
+        # Check if it's a question (but not a facility question)
+        if _is_question(latest_lower):
+            return _clear_slot(tracker, "arrival_date")
 
         arrival_date = tracker.get_slot("arrival_date")
         
         # CRITICAL: If slot is "waiting", it means we're waiting for user to say "continue"
         # Don't process it, just return empty list to wait
-        # Check if booking calendar was just shown
-        latest_action = None
-        events_list = list(tracker.events)
-        for i in range(len(events_list) - 1, max(-1, len(events_list) - 20), -1):
-            event = events_list[i]
-            if hasattr(event, 'action_name') and event.action_name == 'action_show_booking_calendar':
-                latest_action = event.action_name
-                break
-        
-        if latest_action == 'action_show_booking_calendar' and not arrival_date:
-            return []
-
+        # This also covers the booking calendar having just been shown, so there is
+        # no need to scan tracker.events for action_show_booking_calendar
         if not arrival_date:
             return []
 
         is_valid, error_msg = _validate_date(arrival_date)
         if not is_valid:
-            return [SlotSet("arrival_date", None)]
+            return _clear_slot(tracker, "arrival_date")
 
         return []
 
@@ -1731,117 +1811,62 @@ class ValidateDepartureDate(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
-        
+        latest_lower = latest_message.lower().strip()
+
+        def reask_departure_date() -> List[Dict[Text, Any]]:
+            arrival_date = tracker.get_slot("arrival_date")
+            dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload(arrival_date or None))
+            return _clear_slot(tracker, "departure_date")
+
+        # Check if user is responding to "is information sufficient" question
+        events = _handle_info_sufficient_response(
+            tracker, dispatcher, latest_lower, reask_departure_date, wait_for_answer=False
+        )
+        if events is not None:
+            return events
+
         # Check if it's a facility question/statement (BEFORE other checks)
         # This must happen for BOTH questions and statements (like "pool", "parking", etc.)
-        is_facility, facility_response = _is_facility_question(latest_message)
+        is_facility, facility_response = _is_facility_question(latest_lower)
         if is_facility and facility_response:
             dispatcher.utter_message(text=facility_response)
             # Continue with booking flow - ask for departure date
             dispatcher.utter_message(text="Please select your departure date:")
-            return [SlotSet("departure_date", None)]
-        
-        is_question = _is_question(latest_message)
+            return _clear_slot(tracker, "departure_date")
 
-        # Check if user is responding to "is information sufficient" question
-        information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                try:
-                    today = datetime.now()
-                    arrival_date = tracker.get_slot("arrival_date")
-                    calendar_data = {
-                        "type": "calendar",
-                        "mode": "booking",
-                        "message": "Please select your arrival and departure date",
-                        "min_date": today.strftime("%Y-%m-%d"),
-                        "arrival_date": arrival_date if arrival_date else None,
-                        "departure_date": None,
-                    }
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                    dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                except Exception as e:
-                    dispatcher.utter_message(text="Please select your departure date:")
-                return [SlotSet("information_sufficient", None), SlotSet("departure_date", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
-            # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
-            # Return empty list to prevent Rasa from automatically continuing
+        # Still waiting for a yes/no to "is the information sufficient?"
+        if tracker.get_slot("information_sufficient") == ASKED:
             return []
 
-        if is_question or (is_facility and facility_response):
-            if is_facility and facility_response:
-                dispatcher.utter_message(text=facility_response)
-                # Continue with booking flow - ask for departure date
-                dispatcher.utter_message(text="Please select your departure date:")
-                return [SlotSet("departure_date", None)]
-            return [SlotSet("departure_date", None)]
+        # Check if it's a question (but not a facility question)
+        if _is_question(latest_lower):
+            return _clear_slot(tracker, "departure_date")
 
         departure_date = tracker.get_slot("departure_date")
         arrival_date = tracker.get_slot("arrival_date")
 
-        # CRITICAL: If slot is "waiting", it means we're waiting for user to say "continue"
-        # Don't process it, just return empty list to wait
-        # If both dates are already set, validate them
-        if arrival_date and departure_date:
-            is_arrival_valid, _ = _validate_date(arrival_date)
-            is_departure_valid, _ = _validate_date(departure_date)
-
-            if is_arrival_valid and is_departure_valid:
-                # Parse dates to compare
-                arrival_parsed = None
-                departure_parsed = None
-                for fmt in ["%d %B %Y", "%d %b %Y", "%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%d.%m.%Y", "%B %d, %Y", "%b %d, %Y"]:
-                    try:
-                        if arrival_date:
-                            arrival_parsed = datetime.strptime(arrival_date, fmt)
-                        if departure_date:
-                            departure_parsed = datetime.strptime(departure_date, fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if arrival_parsed and departure_parsed:
-                    if departure_parsed <= arrival_parsed:
-                        arrival_str = arrival_parsed.strftime("%d %B %Y")
-                        dispatcher.utter_message(
-                            text=f"The departure date must be after the arrival date ({arrival_str}). Please select a later date."
-                        )
-                        return [SlotSet("departure_date", None)]
+        if not departure_date:
             return []
 
-        if not departure_date:
+        is_departure_valid, _ = _validate_date(departure_date)
+        if not arrival_date:
+            # Nothing to compare against yet - only clear an unusable departure date
+            if not is_departure_valid:
+                return _clear_slot(tracker, "departure_date")
             return []
 
-        is_valid, error_msg = _validate_date(departure_date)
-        if not is_valid:
-            return [SlotSet("departure_date", None)]
+        is_arrival_valid, _ = _validate_date(arrival_date)
+        if not (is_arrival_valid and is_departure_valid):
+            return []
 
         # Check if departure is after arrival
-        if arrival_date:
-            arrival_parsed = None
-            departure_parsed = None
-            for fmt in ["%d %B %Y", "%d %b %Y", "%d-%m-%Y", "%d/%m/%Y", "%Y-%m-%d", "%d.%m.%Y", "%B %d, %Y", "%b %d, %Y"]:
-                try:
-                    if arrival_date:
-                        arrival_parsed = datetime.strptime(arrival_date, fmt)
-                    if departure_date:
-                        departure_parsed = datetime.strptime(departure_date, fmt)
-                    break
-                except ValueError:
-                    continue
-
-            if arrival_parsed and departure_parsed:
-                if departure_parsed <= arrival_parsed:
-                    arrival_str = arrival_parsed.strftime("%d %B %Y")
-                    dispatcher.utter_message(
-                        text=f"The departure date must be after the arrival date ({arrival_str}). Please select a later date."
-                    )
-                    return [SlotSet("departure_date", None)]
+        arrival_parsed = _parse_date(arrival_date)
+        departure_parsed = _parse_date(departure_date)
+        if arrival_parsed and departure_parsed and departure_parsed <= arrival_parsed:
+            dispatcher.utter_message(
+                text=f"The departure date must be after the arrival date ({_fmt_long(arrival_parsed)}). Please select a later date."
+            )
+            return _clear_slot(tracker, "departure_date")
 
         return []
 
@@ -1858,56 +1883,46 @@ class ValidatePaymentOption(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
+        latest_lower = latest_message.lower().strip()
         
+        def reask_payment_option() -> List[Dict[Text, Any]]:
+            # CRITICAL: Clear payment_option slot to None to ensure Rasa knows we're still collecting it
+            # This forces Rasa to stay in the flow and ask the question again
+            dispatcher.utter_message(
+                text="Would you like to pay at the front desk or complete the payment online now?"
+            )
+            return _clear_slot(tracker, "payment_option")
+
         # CRITICAL: Check information_sufficient FIRST, before anything else
-        information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            # Check for yes/continue responses - be more flexible with combinations
-            # First check for explicit yes words
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            # Check if message contains any yes word
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Clear payment_option slot to None to ensure Rasa knows we're still collecting it
-                # This forces Rasa to stay in the flow and ask the question again
-                dispatcher.utter_message(
-                    text="Would you like to pay at the front desk or complete the payment online now?"
-                )
-                # Clear both slots: information_sufficient to exit the question loop, payment_option to restart collection
-                return [SlotSet("information_sufficient", None), SlotSet("payment_option", None)]
-            # Check for no/more questions responses
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
+        events = _handle_info_sufficient_response(
+            tracker, dispatcher, latest_lower, reask_payment_option, wait_for_answer=False
+        )
+        if events is not None:
+            return events
+        if tracker.get_slot("information_sufficient") == ASKED:
             # If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
             # But if it's a very short message (1-2 words) that might be "yes", try to interpret it
             if len(latest_lower.split()) <= 2:
                 # Very short response - likely "yes" or similar
                 dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Clear payment_option slot to None to ensure Rasa knows we're still collecting it
-                # This forces Rasa to stay in the flow and ask the question again
-                dispatcher.utter_message(
-                    text="Would you like to pay at the front desk or complete the payment online now?"
-                )
                 # Clear both slots: information_sufficient to exit the question loop, payment_option to restart collection
-                return [SlotSet("information_sufficient", None), SlotSet("payment_option", None)]
+                return [SlotSet("information_sufficient", None)] + reask_payment_option()
             return []
 
         # Check if it's a facility question/statement (BEFORE checking if payment_option is None)
         # This must happen for BOTH questions and statements (like "pool", "parking", etc.)
-        is_facility, facility_response = _is_facility_question(latest_message)
+        is_facility, facility_response = _is_facility_question(latest_lower)
         if is_facility and facility_response:
             dispatcher.utter_message(text=facility_response)
             # Continue with booking flow - ask for payment option
             dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
-            return [SlotSet("payment_option", None)]
+            return _clear_slot(tracker, "payment_option")
         
         # Check if it's a question (but not a facility question)
-        is_question = _is_question(latest_message)
+        is_question = _is_question(latest_lower)
         if is_question:
             # If it's a question but not a facility question, clear the slot
-            return [SlotSet("payment_option", None)]
+            return _clear_slot(tracker, "payment_option")
 
         payment_option = tracker.get_slot("payment_option")
 
@@ -1920,10 +1935,10 @@ class ValidatePaymentOption(Action):
             )
             return []
 
-        payment_option_lower = str(payment_option).lower().strip()
+        payment_tokens = set(TOKEN_RE.findall(str(payment_option).lower()))
 
         # Normalize payment option
-        if any(word in payment_option_lower for word in ["desk", "front desk", "at desk", "reception", "counter", "cash", "in cash", "pay cash", "cash payment"]):
+        if payment_tokens & DESK_TOKENS:
             # Check if we already have name and email - if so, show summary
             first_name = tracker.get_slot("first_name")
             last_name = tracker.get_slot("last_name")
@@ -1931,7 +1946,7 @@ class ValidatePaymentOption(Action):
             
             if first_name and last_name and email:
                 # All info collected, show summary (will be handled by validate_email)
-                return [SlotSet("payment_option", "at_desk")]
+                return [SlotSet("payment_option", PAYMENT_AT_DESK)]
             else:
                 # Confirm payment and start collecting name/email
                 dispatcher.utter_message(
@@ -1940,13 +1955,13 @@ class ValidatePaymentOption(Action):
                 # Set payment_option and clear slots to trigger flow collection
                 # Don't ask here - let the validate actions or Rasa's automatic utter_ask handle it
                 if not first_name:
-                    return [SlotSet("payment_option", "at_desk"), SlotSet("first_name", None)]
+                    return [SlotSet("payment_option", PAYMENT_AT_DESK), SlotSet("first_name", None)]
                 elif not last_name:
-                    return [SlotSet("payment_option", "at_desk"), SlotSet("last_name", None)]
+                    return [SlotSet("payment_option", PAYMENT_AT_DESK), SlotSet("last_name", None)]
                 elif not email:
-                    return [SlotSet("payment_option", "at_desk"), SlotSet("email", None)]
-                return [SlotSet("payment_option", "at_desk")]
-        elif any(word in payment_option_lower for word in ["online", "now", "pay now", "card", "credit", "debit"]):
+                    return [SlotSet("payment_option", PAYMENT_AT_DESK), SlotSet("email", None)]
+                return [SlotSet("payment_option", PAYMENT_AT_DESK)]
+        elif payment_tokens & ONLINE_TOKENS:
             # Check if we already have name and email - if so, show summary
             first_name = tracker.get_slot("first_name")
             last_name = tracker.get_slot("last_name")
@@ -1954,7 +1969,7 @@ class ValidatePaymentOption(Action):
             
             if first_name and last_name and email:
                 # All info collected, show summary (will be handled by validate_email)
-                return [SlotSet("payment_option", "online")]
+                return [SlotSet("payment_option", PAYMENT_ONLINE)]
             else:
                 # Confirm payment and start collecting name/email
                 dispatcher.utter_message(
@@ -1963,17 +1978,17 @@ class ValidatePaymentOption(Action):
                 # Set payment_option and clear slots to trigger flow collection
                 # Don't ask here - let the validate actions or Rasa's automatic utter_ask handle it
                 if not first_name:
-                    return [SlotSet("payment_option", "online"), SlotSet("first_name", None)]
+                    return [SlotSet("payment_option", PAYMENT_ONLINE), SlotSet("first_name", None)]
                 elif not last_name:
-                    return [SlotSet("payment_option", "online"), SlotSet("last_name", None)]
+                    return [SlotSet("payment_option", PAYMENT_ONLINE), SlotSet("last_name", None)]
                 elif not email:
-                    return [SlotSet("payment_option", "online"), SlotSet("email", None)]
-                return [SlotSet("payment_option", "online")]
+                    return [SlotSet("payment_option", PAYMENT_ONLINE), SlotSet("email", None)]
+                return [SlotSet("payment_option", PAYMENT_ONLINE)]
         else:
             dispatcher.utter_message(
                 text="I didn't understand that. Please choose either 'at the front desk' or 'online'."
             )
-            return [SlotSet("payment_option", None)]
+            return _clear_slot(tracker, "payment_option")
 
 
 class ValidateFirstName(Action):
@@ -2083,10 +2098,10 @@ class ValidateEmail(Action):
             departure_formatted = departure_date if departure_date else "N/A"
             
             # Format room type
-            room_type_display = "Standard" if room_type == "standard" else "Suite" if room_type == "suite" else room_type or "N/A"
+            room_type_display = "Standard" if room_type == ROOM_STANDARD else "Suite" if room_type == ROOM_SUITE else room_type or "N/A"
             
             # Format payment option
-            payment_display = "Online" if payment_option == "online" else "At front desk" if payment_option == "at_desk" else payment_option or "N/A"
+            payment_display = "Online" if payment_option == PAYMENT_ONLINE else "At front desk" if payment_option == PAYMENT_AT_DESK else payment_option or "N/A"
             
             # Build summary message
             summary = f"""Here's your booking summary:
@@ -2144,86 +2159,48 @@ class ValidateInformationSufficient(Action):
         # CRITICAL: Handle "continue_detected" FIRST - this comes from slot mapping
         if information_sufficient == "continue_detected":
             # Determine which slot is currently being collected
-            guests = tracker.get_slot("guests")
-            room_type = tracker.get_slot("room_type")
-            arrival_date = tracker.get_slot("arrival_date")
-            departure_date = tracker.get_slot("departure_date")
-            payment_option = tracker.get_slot("payment_option")
-            
             dispatcher.utter_message(text="Great! Let's continue with your booking.")
             
             # Ask for the appropriate slot based on flow order
-            if not guests:
+            if not tracker.get_slot("guests"):
                 dispatcher.utter_message(text="For how many guests?")
                 return [SlotSet("information_sufficient", None), SlotSet("guests", None)]
-            elif not room_type:
-                dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+            elif not tracker.get_slot("room_type"):
+                dispatcher.utter_message(text=ROOM_PROMPT)
                 return [SlotSet("information_sufficient", None), SlotSet("room_type", None)]
-            elif not arrival_date:
-                try:
-                    today = datetime.now()
-                    calendar_data = {
-                        "type": "calendar",
-                        "mode": "booking",
-                        "message": "Please select your arrival and departure date",
-                        "min_date": today.strftime("%Y-%m-%d"),
-                        "arrival_date": None,
-                        "departure_date": None,
-                    }
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                    dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                except Exception:
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
+            elif not tracker.get_slot("arrival_date"):
+                dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
                 return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-            elif not departure_date:
+            elif not tracker.get_slot("departure_date"):
                 dispatcher.utter_message(text="Please select your departure date:")
                 return [SlotSet("information_sufficient", None), SlotSet("departure_date", None)]
-            elif not payment_option:
+            elif not tracker.get_slot("payment_option"):
                 dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
                 return [SlotSet("information_sufficient", None), SlotSet("payment_option", None)]
         
         # CRITICAL: Check if information_sufficient is "asked" - handle "continue" response
-        if information_sufficient == "asked":
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
+        if information_sufficient == ASKED:
+            reply = _classify_reply(latest_lower)
+            if reply & ReplyKind.YES:
                 # Determine which slot is currently being collected
-                guests = tracker.get_slot("guests")
-                room_type = tracker.get_slot("room_type")
-                arrival_date = tracker.get_slot("arrival_date")
-                departure_date = tracker.get_slot("departure_date")
-                payment_option = tracker.get_slot("payment_option")
-                
                 dispatcher.utter_message(text="Great! Let's continue with your booking.")
                 
-                if not guests:
+                if not tracker.get_slot("guests"):
                     dispatcher.utter_message(text="For how many guests?")
                     return [SlotSet("information_sufficient", None), SlotSet("guests", None)]
-                elif not room_type:
-                    dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+                elif not tracker.get_slot("room_type"):
+                    dispatcher.utter_message(text=ROOM_PROMPT)
                     return [SlotSet("information_sufficient", None), SlotSet("room_type", None)]
-                elif not arrival_date:
-                    try:
-                        today = datetime.now()
-                        calendar_data = {
-                            "type": "calendar",
-                            "mode": "booking",
-                            "message": "Please select your arrival and departure date",
-                            "min_date": today.strftime("%Y-%m-%d"),
-                            "arrival_date": None,
-                            "departure_date": None,
-                        }
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
-                        dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                    except Exception:
-                        dispatcher.utter_message(text="Please select your arrival and departure date:")
+                elif not tracker.get_slot("arrival_date"):
+                    dispatcher.utter_message(text=CALENDAR_PROMPT, custom=_calendar_payload())
                     return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-                elif not departure_date:
+                elif not tracker.get_slot("departure_date"):
                     dispatcher.utter_message(text="Please select your departure date:")
                     return [SlotSet("information_sufficient", None), SlotSet("departure_date", None)]
-                elif not payment_option:
+                elif not tracker.get_slot("payment_option"):
                     dispatcher.utter_message(text="Would you like to pay at the front desk or complete the payment online now?")
                     return [SlotSet("information_sufficient", None), SlotSet("payment_option", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
+            elif reply & ReplyKind.NO:
                 dispatcher.utter_message(text="How can I assist you further?")
                 return [SlotSet("information_sufficient", None)]
             # CRITICAL: If information_sufficient is "asked" but user hasn't responded yes/no yet,
@@ -2250,7 +2227,7 @@ class ValidateGuests(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
-        latest_lower = latest_message.lower().strip() if latest_message else ""
+        latest_lower = latest_message.lower().strip()
 
         # Check if user is responding to "is information sufficient" question
         information_sufficient = tracker.get_slot("information_sufficient")
@@ -2274,21 +2251,16 @@ class ValidateGuests(Action):
             dispatcher.utter_message(text="How can I assist you further?")
             return [SlotSet("information_sufficient", None)]
         
-        # CRITICAL: Check for "continue" response when information_sufficient == "asked"
+        # CRITICAL: Check for "continue" response when information_sufficient == ASKED
         # This handles cases where slot mapping didn't set "continue_detected" yet
         # This MUST happen BEFORE fallback is triggered - handle it DIRECTLY here
-        if information_sufficient == "asked":
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                # Handle continue DIRECTLY here to prevent fallback
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                dispatcher.utter_message(text="For how many guests?")
-                return [SlotSet("information_sufficient", None), SlotSet("guests", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
-            # If information_sufficient is "asked" but user hasn't responded yes/no yet, wait
-            return []
+        def reask_guests() -> List[Dict[Text, Any]]:
+            dispatcher.utter_message(text="For how many guests?")
+            return _clear_slot(tracker, "guests")
+
+        events = _handle_info_sufficient_response(tracker, dispatcher, latest_lower, reask_guests)
+        if events is not None:
+            return events
         
         # Handle special "__continue__" marker value set by slot mapping or action_handle_continue
         if guests == "__continue__":
@@ -2299,18 +2271,18 @@ class ValidateGuests(Action):
         # Check if the latest user message is a question (not an answer)
         # Check if it's a facility question/statement (BEFORE checking if guests is None)
         # This must happen for BOTH questions and statements (like "pool", "parking", etc.)
-        is_facility, facility_response = _is_facility_question(latest_message)
+        is_facility, facility_response = _is_facility_question(latest_lower)
         if is_facility and facility_response:
             dispatcher.utter_message(text=facility_response)
             # Continue with booking flow - ask for guests
             dispatcher.utter_message(text="For how many guests?")
-            return [SlotSet("guests", None)]
+            return _clear_slot(tracker, "guests")
         
         # Check if it's a question (but not a facility question)
-        is_question = _is_question(latest_message)
+        is_question = _is_question(latest_lower)
         if is_question:
             # If it's a question but not a facility question, clear the slot
-            return [SlotSet("guests", None)]
+            return _clear_slot(tracker, "guests")
 
         if not guests:
             # Only ask if information_sufficient is NOT "asked"
@@ -2341,11 +2313,11 @@ class ValidateGuests(Action):
             # Only ask if:
             # 1. information_sufficient is NOT "asked" (we're not waiting for user to say continue)
             # 2. action_ask_guests was NOT called OR no message was sent yet
-            if information_sufficient != "asked" and not action_ask_guests_message_sent:
+            if information_sufficient != ASKED and not action_ask_guests_message_sent:
                 dispatcher.utter_message(text="For how many guests?")
             return []
         
-        is_valid, error_msg, parsed_value = _validate_positive_number(guests, "number of guests", allow_zero=False)
+        is_valid, error_msg, parsed_value = _validate_guests(guests)
         
         if not is_valid:
             dispatcher.utter_message(
@@ -2354,14 +2326,14 @@ class ValidateGuests(Action):
                     "For example, you could say 'one guest', 'two guests', or just '1' or '2'."
                 )
             )
-            return [SlotSet("guests", None)]
+            return _clear_slot(tracker, "guests")
         
         # Successfully validated guests - now ask for room type to continue the flow
         # Check if room_type is not set yet, and if so, ask for it immediately
         room_type = tracker.get_slot("room_type")
         if not room_type:
             # Ask for room type to continue the booking flow
-            dispatcher.utter_message(text="Which room would you like? (standard or suite)")
+            dispatcher.utter_message(text=ROOM_PROMPT)
         
         # Set the validated guests slot
         return [SlotSet("guests", str(int(parsed_value)))]
@@ -2379,55 +2351,37 @@ class ValidateNights(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
+        latest_lower = latest_message.lower().strip()
 
         # Check if user is responding to "is information sufficient" question
-        information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Show calendar widget again for arrival_date - clear the slot to restart collection
-                try:
-                    today = datetime.now()
-                    calendar_data = {
-                        "type": "calendar",
-                        "mode": "booking",
-                        "message": "Please select your arrival and departure date",
-                        "min_date": today.strftime("%Y-%m-%d"),
-                        "arrival_date": None,
-                        "departure_date": None,
-                    }
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                    dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                except Exception as e:
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
+        # CRITICAL: On "yes", show calendar widget again for arrival_date - clear the slot to restart collection
+        events = _handle_info_sufficient_response(
+            tracker, dispatcher, latest_lower, lambda: _reask_arrival_date(dispatcher, tracker), wait_for_answer=False
+        )
+        if events is not None:
+            return events
 
         # Check if the latest user message is a question (not an answer)
-        is_question = _is_question(latest_message)
+        is_question = _is_question(latest_lower)
 
         if is_question:
             # Check if it's a facility question we can answer
-            is_facility, facility_response = _is_facility_question(latest_message)
+            is_facility, facility_response = _is_facility_question(latest_lower)
             if is_facility and facility_response:
                 dispatcher.utter_message(text=facility_response)
                 dispatcher.utter_message(
                     text="I hope I've provided you with sufficient information. Is there anything else you'd like to know, or shall we continue with your booking?"
                 )
-                return [SlotSet("nights", None), SlotSet("information_sufficient", "asked")]
+                return [SlotSet("nights", None), SlotSet("information_sufficient", ASKED)]
             # If it's a question but not a facility question, clear the slot
-            return [SlotSet("nights", None)]
+            return _clear_slot(tracker, "nights")
 
         nights = tracker.get_slot("nights")
         
         if not nights:
             return []
         
-        is_valid, error_msg, parsed_value = _validate_positive_number(nights, "number of nights", allow_zero=False)
+        is_valid, error_msg, parsed_value = _validate_nights(nights)
         
         if not is_valid:
             dispatcher.utter_message(
@@ -2436,7 +2390,7 @@ class ValidateNights(Action):
                     "For example, you could say 'one night', 'two nights', or just '1' or '2'."
                 )
             )
-            return [SlotSet("nights", None)]
+            return _clear_slot(tracker, "nights")
         
         return [SlotSet("nights", str(int(parsed_value)))]
 
@@ -2453,55 +2407,37 @@ class ValidateRooms(Action):
         domain: Dict[Text, Any],
     ) -> List[Dict[Text, Any]]:
         latest_message = tracker.latest_message.get("text", "") if tracker.latest_message else ""
+        latest_lower = latest_message.lower().strip()
 
         # Check if user is responding to "is information sufficient" question
-        information_sufficient = tracker.get_slot("information_sufficient")
-        if information_sufficient == "asked":
-            latest_lower = latest_message.lower().strip()
-            yes_words = ["yes", "yeah", "yep", "sure", "ok", "okay", "continue", "go ahead", "ja", "jep", "oké", "doorgaan", "proceed", "let's go", "lets go", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-            if any(word in latest_lower for word in yes_words):
-                dispatcher.utter_message(text="Great! Let's continue with your booking.")
-                # CRITICAL: Show calendar widget again for arrival_date - clear the slot to restart collection
-                try:
-                    today = datetime.now()
-                    calendar_data = {
-                        "type": "calendar",
-                        "mode": "booking",
-                        "message": "Please select your arrival and departure date",
-                        "min_date": today.strftime("%Y-%m-%d"),
-                        "arrival_date": None,
-                        "departure_date": None,
-                    }
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                    dispatcher.utter_message(text="", custom=json.dumps(calendar_data))
-                except Exception as e:
-                    dispatcher.utter_message(text="Please select your arrival and departure date:")
-                return [SlotSet("information_sufficient", None), SlotSet("arrival_date", None)]
-            elif any(word in latest_lower for word in ["no", "nope", "nee", "more", "else", "other", "another"]) and "no more" not in latest_lower and "don't need" not in latest_lower:
-                dispatcher.utter_message(text="How can I assist you further?")
-                return [SlotSet("information_sufficient", None)]
+        # CRITICAL: On "yes", show calendar widget again for arrival_date - clear the slot to restart collection
+        events = _handle_info_sufficient_response(
+            tracker, dispatcher, latest_lower, lambda: _reask_arrival_date(dispatcher, tracker), wait_for_answer=False
+        )
+        if events is not None:
+            return events
 
         # Check if the latest user message is a question (not an answer)
-        is_question = _is_question(latest_message)
+        is_question = _is_question(latest_lower)
 
         if is_question:
             # Check if it's a facility question we can answer
-            is_facility, facility_response = _is_facility_question(latest_message)
+            is_facility, facility_response = _is_facility_question(latest_lower)
             if is_facility and facility_response:
                 dispatcher.utter_message(text=facility_response)
                 dispatcher.utter_message(
                     text="I hope I've provided you with sufficient information. Is there anything else you'd like to know, or shall we continue with your booking?"
                 )
-                return [SlotSet("rooms", None), SlotSet("information_sufficient", "asked")]
+                return [SlotSet("rooms", None), SlotSet("information_sufficient", ASKED)]
             # If it's a question but not a facility question, clear the slot
-            return [SlotSet("rooms", None)]
+            return _clear_slot(tracker, "rooms")
 
         rooms = tracker.get_slot("rooms")
         
         if not rooms:
             return []
         
-        is_valid, error_msg, parsed_value = _validate_positive_number(rooms, "number of rooms", allow_zero=False)
+        is_valid, error_msg, parsed_value = _validate_rooms(rooms)
         
         if not is_valid:
             dispatcher.utter_message(
@@ -2510,6 +2446,6 @@ class ValidateRooms(Action):
                     "For example, you could say 'one room', 'two rooms', or just '1' or '2'."
                 )
             )
-            return [SlotSet("rooms", None)]
+            return _clear_slot(tracker, "rooms")
         
         return [SlotSet("rooms", str(int(parsed_value)))]
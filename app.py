@@ -3,10 +3,15 @@ import os
 import re
 import requests
 import logging
-from flask import Flask, send_from_directory, request, jsonify
+import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from flask import Flask, Response, send_from_directory, request, jsonify
 from flask_cors import CORS
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 from dotenv import load_dotenv
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file
 load_dotenv()
@@ -18,11 +23,156 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__, static_folder='frontend')
+# Keep reply JSON in insertion order and emit non-ASCII text (€, emoji) as UTF-8 rather than \u escapes
+app.json.sort_keys = False
+app.json.ensure_ascii = False
+# Never pretty-print, not even under FLASK_DEBUG=1
+app.json.compact = True
 
 CORS(app, resources={r"/*": {"origins": "*"}})
 
+class _LazyJSON:
+    """Log argument that is only serialised to JSON if the record is actually emitted."""
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return json.dumps(self.obj, default=str)
+
+
+# Shared read-only stand-in for a missing slots dict, so lookups don't allocate a fresh {} each time
+EMPTY_SLOTS = MappingProxyType({})
+
+# Booking slots cleared (set to None) in the context when a new booking starts
+RESET_BOOKING_SLOTS = MappingProxyType(dict.fromkeys(
+    ('guests', 'room_type', 'arrival_date', 'departure_date', 'nights', 'rooms', 'payment_option')
+))
+
 # Default Rasa server URL
-DEFAULT_RASA_URL = 'http://localhost:5005/webhooks/rest/webhook'
+DEFAULT_RASA_URL = 'http://localhost:5005'
+
+RASA_WEBHOOK_PATH = '/webhooks/rest/webhook'
+
+# Resolve the Rasa endpoints once; RASA_URL may be the server root or (as before) its REST webhook URL
+RASA_BASE_URL = os.environ.get('RASA_URL', DEFAULT_RASA_URL).rstrip('/')
+if RASA_BASE_URL.endswith(RASA_WEBHOOK_PATH):
+    RASA_BASE_URL = RASA_BASE_URL[:-len(RASA_WEBHOOK_PATH)]
+RASA_WEBHOOK_URL = RASA_BASE_URL + RASA_WEBHOOK_PATH
+
+# Only slots are read from the tracker, so ask Rasa to leave out its ever-growing event list
+TRACKER_PARAMS = {'include_events': 'NONE'}
+
+
+def _pooled_session():
+    """Create a requests session that keeps connections alive across requests."""
+    session = requests.Session()
+    # One quick retry covers a pooled connection the server already closed; urllib3 never
+    # retries a POST once it may have been sent, so a chat message is not delivered twice
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=Retry(total=1, backoff_factor=0.1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Reuse keep-alive connections instead of a new TCP (and TLS) handshake on every upstream call
+rasa_session = _pooled_session()
+elevenlabs_session = _pooled_session()
+
+# Give up quickly when an upstream host is unreachable; the read timeouts below stay per call
+CONNECT_TIMEOUT = 3
+
+# Hotel-related keywords
+HOTEL_KEYWORDS = (
+    # Booking related
+    'book', 'booking', 'reserve', 'reservation', 'room', 'rooms', 'suite', 'standard',
+    'guest', 'guests', 'stay', 'staying', 'check-in', 'checkout', 'check-out',
+    # Payment related
+    'pay', 'payment', 'online', 'desk', 'front desk', 'card', 'credit', 'debit',
+    # Dates
+    'arrival', 'departure', 'date', 'dates', 'night', 'nights', 'day', 'days',
+    # Facilities
+    'pool', 'parking', 'breakfast', 'lunch', 'dinner', 'gym', 'facility', 'facilities',
+    'amenity', 'amenities', 'wifi', 'internet', 'elevator', 'lift', 'wheelchair',
+    # Hotel services
+    'cancel', 'cancellation', 'booking number', 'reference', 'hotel', 'stayassist',
+    # Questions about hotel
+    'price', 'cost', 'fee', 'fees', 'available', 'availability', 'open', 'hours',
+    'time', 'times', 'when', 'what', 'which', 'how much', 'how many',
+    # Greetings (allowed)
+    'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings',
+    # Continuation (allowed during booking)
+    'continue', 'yes', 'ok', 'okay', 'proceed', 'go ahead', 'sure', 'yeah', 'yep',
+    # Personal details (during booking)
+    'name', 'first name', 'last name', 'email', 'address',
+    # Numbers (likely booking related)
+    'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+    '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
+)
+
+# Blocked content patterns
+BLOCKED_PATTERNS = (
+    # Programming
+    'code', 'programming', 'python', 'javascript', 'function', 'variable', 'debug', 'error',
+    'script', 'algorithm', 'api', 'json', 'html', 'css', 'sql', 'database',
+    # Personal questions about bot
+    'what are you', 'who are you', 'what is your', 'tell me about yourself',
+    'what model', 'which model', 'what ai', 'what llm', 'what system',
+    'how are you built', 'how do you work', 'what are your rules',
+    # Discussions
+    'discuss', 'debate', 'opinion', 'think about', 'what do you think',
+    # Jokes
+    'joke', 'funny', 'humor', 'laugh',
+    # Insults
+    'stupid', 'idiot', 'dumb', 'useless', 'bad', 'terrible', 'hate',
+    # Threats
+    'threat', 'harm', 'hurt', 'kill', 'destroy',
+    # Test questions
+    'test', 'testing', 'trial',
+    # Prompt injection
+    'ignore', 'forget', 'disregard', 'override', 'change your', 'pretend you are',
+    'act as', 'roleplay', 'role play', 'imagine', 'suppose', 'assume',
+    'reveal', 'show me your', 'what are your instructions',
+    'system prompt', 'initial prompt',
+)
+
+# Short replies that are always allowed (a number, common booking response, or continuation word)
+ALLOWED_SHORT_REPLIES = frozenset({
+    'yes', 'ok', 'okay', 'no', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
+    'standard', 'suite', 'online', 'desk', 'continue', 'proceed', 'go ahead', 'sure',
+})
+
+GREETING_WORDS = ('hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings', 'greet')
+
+# Whole messages allowed without scanning: short booking replies and bare greetings
+ALWAYS_ALLOWED_MESSAGES = ALLOWED_SHORT_REPLIES | frozenset(GREETING_WORDS)
+
+
+def _substring_re(words):
+    """Compile words into one alternation that matches wherever any of them occurs as a substring.
+
+    Words are bucketed by first character, so at each position of the message the engine only
+    tries the words starting with that character instead of every word in the list."""
+    # A word containing another listed word can never be the only match ("rooms" vs "room"), so drop it
+    kept = []
+    for word in sorted(set(words), key=len):
+        if not any(shorter in word for shorter in kept):
+            kept.append(word)
+
+    buckets = {}
+    for word in kept:
+        buckets.setdefault(word[0], []).append(re.escape(word[1:]))
+    return re.compile('|'.join(
+        re.escape(first) + ('(?:' + '|'.join(rests) + ')' if rests != [''] else '')
+        for first, rests in buckets.items()
+    ))
+
+
+# One regex pass per category instead of a Python-level `in` scan per keyword
+HOTEL_KEYWORDS_RE = _substring_re(HOTEL_KEYWORDS)
+BLOCKED_PATTERNS_RE = _substring_re(BLOCKED_PATTERNS)
+GREETING_WORDS_RE = _substring_re(GREETING_WORDS)
 
 # Security: Check if message is hotel-related
 def is_hotel_related(message):
@@ -32,114 +182,115 @@ def is_hotel_related(message):
     if not message:
         return False
     
-    message_lower = message.lower().strip()
-    
-    # Hotel-related keywords
-    hotel_keywords = [
-        # Booking related
-        'book', 'booking', 'reserve', 'reservation', 'room', 'rooms', 'suite', 'standard',
-        'guest', 'guests', 'stay', 'staying', 'check-in', 'check-in', 'checkout', 'check-out',
-        # Payment related
-        'pay', 'payment', 'online', 'desk', 'front desk', 'card', 'credit', 'debit',
-        # Dates
-        'arrival', 'departure', 'date', 'dates', 'night', 'nights', 'day', 'days',
-        # Facilities
-        'pool', 'parking', 'breakfast', 'lunch', 'dinner', 'gym', 'facility', 'facilities',
-        'amenity', 'amenities', 'wifi', 'internet', 'elevator', 'lift', 'wheelchair',
-        # Hotel services
-        'cancel', 'cancellation', 'booking number', 'reference', 'hotel', 'stayassist',
-        # Questions about hotel
-        'price', 'cost', 'fee', 'fees', 'available', 'availability', 'open', 'hours',
-        'time', 'times', 'when', 'what', 'which', 'how much', 'how many',
-        # Greetings (allowed)
-        'hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings',
-        # Continuation (allowed during booking)
-        'continue', 'yes', 'ok', 'okay', 'proceed', 'go ahead', 'sure', 'yeah', 'yep',
-        # Personal details (during booking)
-        'name', 'first name', 'last name', 'email', 'address',
-        # Numbers (likely booking related)
-        'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
-        '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
-    ]
+    return _is_hotel_related_text(message.lower().strip())
+
+
+# Users repeat short replies ("yes", "ok", "2") a lot, so classify each normalized text once
+@lru_cache(maxsize=4096)
+def _is_hotel_related_text(message_lower):
+    # Most replies during a booking are a bare "yes", "2" or "standard" (or a greeting) - allow
+    # those with one set lookup before any pattern scanning
+    if message_lower in ALWAYS_ALLOWED_MESSAGES:
+        return True
     
     # Check if message contains hotel-related keywords
-    if any(keyword in message_lower for keyword in hotel_keywords):
+    if HOTEL_KEYWORDS_RE.search(message_lower):
         return True
     
-    # Blocked content patterns
-    blocked_patterns = [
-        # Programming
-        'code', 'programming', 'python', 'javascript', 'function', 'variable', 'debug', 'error',
-        'script', 'algorithm', 'api', 'json', 'html', 'css', 'sql', 'database',
-        # Personal questions about bot
-        'what are you', 'who are you', 'what is your', 'tell me about yourself',
-        'what model', 'which model', 'what ai', 'what llm', 'what system',
-        'how are you built', 'how do you work', 'what are your rules',
-        # Discussions
-        'discuss', 'debate', 'opinion', 'think about', 'what do you think',
-        # Jokes
-        'joke', 'funny', 'humor', 'laugh',
-        # Insults
-        'stupid', 'idiot', 'dumb', 'useless', 'bad', 'terrible', 'hate',
-        # Threats
-        'threat', 'harm', 'hurt', 'kill', 'destroy',
-        # Test questions
-        'test', 'testing', 'debug', 'trial',
-        # Prompt injection
-        'ignore', 'forget', 'disregard', 'override', 'change your', 'pretend you are',
-        'act as', 'roleplay', 'role play', 'imagine', 'suppose', 'assume',
-        'reveal', 'show me your', 'what are your instructions', 'what are your rules',
-        'system prompt', 'initial prompt',
-    ]
-    
     # Check if message contains blocked patterns
-    if any(pattern in message_lower for pattern in blocked_patterns):
+    if BLOCKED_PATTERNS_RE.search(message_lower):
         return False
     
     # Allow greetings (always allowed)
-    greeting_words = ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening', 'greetings', 'greet']
-    if any(greeting in message_lower for greeting in greeting_words):
+    if GREETING_WORDS_RE.search(message_lower):
         return True
     
-    # Allow short responses that are likely booking-related
-    if len(message_lower.split()) <= 2:
-        # Allow if it's a number, common booking response, or continuation word
-        allowed_short = ['yes', 'ok', 'okay', 'no', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
-                        'standard', 'suite', 'online', 'desk', 'continue', 'proceed', 'go ahead', 'sure']
-        if message_lower in allowed_short:
-            return True
-    
-    # If message contains blocked patterns, definitely block
-    # This check happens after allowing greetings and short responses
-    if any(pattern in message_lower for pattern in blocked_patterns):
-        return False
-    
     # If no hotel keywords found and not clearly blocked, check if it's a simple question/statement
     # Allow if it's a very short message that might be a booking response
     # Otherwise, default to allowing (let Rasa/LLM handle it with the security prompt)
     # The LLM prompt will catch anything that slips through
     return True
 
+def _whole_word_re(words):
+    """Compile words into one alternation that only matches them as whole words."""
+    # Use word boundaries to match whole words only, not substrings (prevents "book room" from matching "go" in "go ahead")
+    return re.compile(r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b')
+
+
+# Replies that mean "carry on with the booking"; the fallback filter only needs the short ones
+CONTINUE_WORDS = ("continue", "yes", "ok", "okay", "proceed", "go ahead", "let's go", "lets go", "sure", "yeah", "yep", "ja", "jep", "oké", "doorgaan")
+CONTINUE_PHRASES = ("i dont need anymore", "i don't need anymore", "no more", "no more questions")
+
+# Continue replies checked against the tracker before calling Rasa, and those that filter fallbacks out of Rasa's answer
+CONTINUE_MESSAGE_RE = _whole_word_re(CONTINUE_WORDS + CONTINUE_PHRASES)
+CONTINUE_WORD_RE = _whole_word_re(CONTINUE_WORDS)
+
+# Phrases that start a fresh booking (slots are reset and a new sender ID is issued)
+BOOKING_PHRASES = ("book a room", "book room", "i want to book", "reserve a room", "make a reservation", "reserve", "booking")
+BOOKING_PHRASE_RE = _substring_re(BOOKING_PHRASES)
+
+# Earlier messages that show a facility question was answered, and that a booking is in progress
+FACILITY_INDICATORS = ("breakfast", "pool", "parking", "gym", "lunch", "dinner", "is served", "is open", "is available")
+BOOKING_INDICATORS = ("for how many guests", "which room", "arrival", "departure", "payment", "front desk", "online")
+
+# Rasa fallback replies, dropped when the user said "continue" or was just asked if the information was sufficient
+FALLBACK_PHRASES = (
+    "i'm sorry i am unable to understand you",
+    "could you please rephrase",
+    "i'm sorry",
+    "unable to understand",
+    "please rephrase",
+    "utter_ask_rephrase"
+)
+
+# HTML tags stripped from text before it is spoken
+HTML_TAG_RE = re.compile(r'<[^>]*>?')
+
+# Fixed replies sent back when send_message fails (only serialized, never mutated)
+RASA_ERROR_MESSAGES = ({"text": "I'm sorry, I encountered an error processing your request. Please try again later."},)
+UNEXPECTED_ERROR_MESSAGES = ({"text": "I apologize, but I encountered an issue processing your request. Please try again."},)
+
+
+@lru_cache(maxsize=4096)
+def _is_continue_text(message_lower):
+    """Return True if the lowercased, stripped message contains a continue word or phrase."""
+    return CONTINUE_MESSAGE_RE.search(message_lower) is not None
+
+def _list_static_files(folder):
+    """Return every file under folder as a URL-style path relative to it (e.g. 'js/app.js')."""
+    files = set()
+    for root, _dirs, names in os.walk(folder):
+        rel_root = os.path.relpath(root, folder).replace(os.sep, '/')
+        for name in names:
+            files.add(name if rel_root == '.' else f"{rel_root}/{name}")
+    return frozenset(files)
+
+
+# app.static_folder re-joins root_path on every access; resolve it once
+STATIC_FOLDER = app.static_folder
+
+# The frontend is fixed once the server starts, so asset lookups need no stat() per request
+STATIC_FILES = _list_static_files(STATIC_FOLDER)
+
 # Serve frontend files
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve_static(path):
-    if path and os.path.exists(os.path.join(app.static_folder, path)):
-        return send_from_directory(app.static_folder, path)
-    return send_from_directory(app.static_folder, 'index.html')
+    if path and path in STATIC_FILES:
+        return send_from_directory(STATIC_FOLDER, path)
+    return send_from_directory(STATIC_FOLDER, 'index.html')
 
 @app.route('/api/check_rasa', methods=['GET'])
 def check_rasa():
-    rasa_url = os.environ.get('RASA_URL', 'http://localhost:5005')
     try:
         # Try to connect to the server's health endpoint
-        response = requests.get(f"{rasa_url}/version", timeout=3)
+        response = rasa_session.get(f"{RASA_BASE_URL}/version", timeout=(CONNECT_TIMEOUT, 3))
         if response.ok:
             return jsonify({"status": "available", "version": response.json()})
         else:
             return jsonify({"status": "unavailable", "reason": "API responded with error"}), 503
     except RequestException as e:
-        logger.error(f"Failed to connect to Rasa server: {str(e)}")
+        logger.error("Failed to connect to Rasa server: %s", e)
         return jsonify({"status": "unavailable", "reason": str(e)}), 503
 
 
@@ -150,11 +301,11 @@ def send_message():
     message = data.get('message')
     context = data.get('context', {})
 
-    logger.info(f"🔵 Received message: '{message}', context sender_id: {context.get('sender_id', 'user')}")
+    logger.info("🔵 Received message: '%s', context sender_id: %s", message, context.get('sender_id', 'user'))
     
     # SECURITY: Check if message is hotel-related
     if message and not is_hotel_related(message):
-        logger.warning(f"🚫 SECURITY BLOCK: Non-hotel related message blocked: '{message}'")
+        logger.warning("🚫 SECURITY BLOCK: Non-hotel related message blocked: '%s'", message)
         return jsonify({
             "messages": [{"text": "I can only help with hotel related matters."}],
             "context": context,
@@ -163,30 +314,29 @@ def send_message():
     
     # CRITICAL: Handle "continue" response when information_sufficient == "asked"
     # This MUST happen BEFORE calling Rasa to prevent fallback from being triggered
-    continue_words = ["continue", "yes", "ok", "okay", "proceed", "go ahead", "let's go", "lets go", "sure", "yeah", "yep", "ja", "jep", "oké", "doorgaan", "i dont need anymore", "i don't need anymore", "no more", "no more questions"]
-    is_continue_message = message and any(word in message.lower().strip() for word in continue_words)
-    logger.info(f"🔵 Is continue message? {is_continue_message}, message: '{message}'")
+    is_continue_message = message and _is_continue_text(message.lower().strip())
+    logger.info("🔵 Is continue message? %s, message: '%s'", is_continue_message, message)
     
     if is_continue_message:
         # Get current conversation state from Rasa
         sender_id = context.get('sender_id', 'user')
-        logger.info(f"🔵 Checking tracker for sender_id: {sender_id}")
+        logger.info("🔵 Checking tracker for sender_id: %s", sender_id)
         
         try:
             # Make a request to get current tracker state
-            tracker_url = f"{os.environ.get('RASA_URL', DEFAULT_RASA_URL).rstrip('/')}/conversations/{sender_id}/tracker"
-            logger.info(f"🔵 Fetching tracker from: {tracker_url}")
-            tracker_response = requests.get(tracker_url, timeout=5)
-            logger.info(f"🔵 Tracker response status: {tracker_response.status_code}")
+            tracker_url = f"{RASA_BASE_URL}/conversations/{sender_id}/tracker"
+            logger.info("🔵 Fetching tracker from: %s", tracker_url)
+            tracker_response = rasa_session.get(tracker_url, params=TRACKER_PARAMS, timeout=(CONNECT_TIMEOUT, 5))
+            logger.info("🔵 Tracker response status: %s", tracker_response.status_code)
             
             if tracker_response.status_code == 200:
                 tracker_data = tracker_response.json()
-                slots = tracker_data.get('slots', {})
+                slots = tracker_data.get('slots') or EMPTY_SLOTS
                 information_sufficient = slots.get('information_sufficient')
-                logger.info(f"🔵 CRITICAL CHECK: message='{message}', information_sufficient={information_sufficient}, all slots: {slots}")
+                logger.info("🔵 CRITICAL CHECK: message='%s', information_sufficient=%s, all slots: %s", message, information_sufficient, slots)
                 
                 if information_sufficient == "asked":
-                    logger.info(f"✅✅✅ Detected 'continue' when information_sufficient == 'asked', responding directly WITHOUT calling Rasa")
+                    logger.info("✅✅✅ Detected 'continue' when information_sufficient == 'asked', responding directly WITHOUT calling Rasa")
                     # Determine which slot is currently being collected
                     guests = slots.get('guests')
                     room_type = slots.get('room_type')
@@ -194,7 +344,7 @@ def send_message():
                     departure_date = slots.get('departure_date')
                     payment_option = slots.get('payment_option')
                     
-                    logger.info(f"🔵 Current slots: guests={guests}, room_type={room_type}, arrival_date={arrival_date}, departure_date={departure_date}, payment_option={payment_option}")
+                    logger.info("🔵 Current slots: guests=%s, room_type=%s, arrival_date=%s, departure_date=%s, payment_option=%s", guests, room_type, arrival_date, departure_date, payment_option)
                     
                     # Respond directly without going through Rasa to avoid fallback
                     messages = [{"text": "Great! Let's continue with your booking."}]
@@ -211,7 +361,7 @@ def send_message():
                         messages.append({"text": "Would you like to pay at the front desk or complete the payment online now?"})
                     
                     # Update slots in Rasa tracker for consistency
-                    events_url = f"{os.environ.get('RASA_URL', DEFAULT_RASA_URL).rstrip('/')}/conversations/{sender_id}/tracker/events"
+                    events_url = f"{RASA_BASE_URL}/conversations/{sender_id}/tracker/events"
                     slot_events = [
                         {"event": "slot", "name": "information_sufficient", "value": None}
                     ]
@@ -227,12 +377,13 @@ def send_message():
                     elif not payment_option:
                         slot_events.append({"event": "slot", "name": "payment_option", "value": None})
                     
+                    # Sent before replying: the next turn's validators read information_sufficient from the tracker
                     try:
-                        for event in slot_events:
-                            requests.post(events_url, json=event, timeout=5)
-                        logger.info(f"🔵 Updated slots in Rasa tracker")
+                        # The events endpoint accepts a list, so all resets go in one round trip
+                        rasa_session.post(events_url, json=slot_events, timeout=(CONNECT_TIMEOUT, 5))
+                        logger.info("🔵 Updated slots in Rasa tracker")
                     except Exception as e:
-                        logger.warning(f"Could not update slots in Rasa: {e}")
+                        logger.warning("Could not update slots in Rasa: %s", e)
                     
                     # Update context
                     if 'slots' not in context:
@@ -240,50 +391,35 @@ def send_message():
                     context['slots']['information_sufficient'] = None
                     
                     # Return response directly without calling Rasa - THIS PREVENTS FALLBACK
-                    logger.info(f"✅✅✅ Returning direct response for 'continue': {messages}")
+                    logger.info("✅✅✅ Returning direct response for 'continue': %s", messages)
                     return jsonify({
                         "messages": messages,
                         "context": context,
                         "actions": []
                     })
                 else:
-                    logger.info(f"🔵 information_sufficient is '{information_sufficient}', not 'asked', will proceed with normal Rasa flow")
+                    logger.info("🔵 information_sufficient is '%s', not 'asked', will proceed with normal Rasa flow", information_sufficient)
             else:
-                logger.warning(f"🔵 Tracker response not 200: {tracker_response.status_code}, {tracker_response.text}")
+                logger.warning("🔵 Tracker response not 200: %s, %s", tracker_response.status_code, tracker_response.text)
         except Exception as e:
-            logger.error(f"🔵 ERROR checking tracker state: {e}", exc_info=True)
+            logger.error("🔵 ERROR checking tracker state: %s", e, exc_info=True)
     
     # Store last message in context for fallback filtering (only if we didn't return early)
     if message:
         context['last_message'] = message
     
     # Reset booking slots when starting a new booking
-    booking_phrases = ["book a room", "book room", "i want to book", "reserve a room", "make a reservation", "reserve", "booking"]
-    if message and any(phrase in message.lower() for phrase in booking_phrases):
+    is_new_booking = bool(message) and BOOKING_PHRASE_RE.search(message.lower()) is not None
+    if is_new_booking:
         logger.info("Detected new booking request, resetting booking slots")
-        # Clear booking-related slots in context
-        if 'slots' not in context:
-            context['slots'] = {}
-        # Reset booking slots - explicitly set to None to clear them
-        context['slots']['guests'] = None
-        context['slots']['room_type'] = None
-        context['slots']['arrival_date'] = None
-        context['slots']['departure_date'] = None
-        context['slots']['nights'] = None
-        context['slots']['rooms'] = None
-        context['slots']['payment_option'] = None
-        logger.info(f"Reset booking slots: {context['slots']}")
-
-    rasa_url = os.environ.get('RASA_URL', DEFAULT_RASA_URL)
-    
-    # Use a unique sender ID for each new booking to ensure slots are reset
+        # Clear booking-related slots in context - explicitly set to None to clear them
+        context.setdefault('slots', {}).update(RESET_BOOKING_SLOTS)
+        logger.info("Reset booking slots: %s", context['slots'])
+        # Use a unique sender ID for each new booking to ensure a fresh conversation
+        context['sender_id'] = f"user_{uuid.uuid4().hex[:8]}"
+        logger.info("Generated new sender ID for booking: %s", context['sender_id'])
+
     sender_id = context.get('sender_id', 'user')
-    if message and any(phrase in message.lower() for phrase in booking_phrases):
-        # Generate a new sender ID for this booking to ensure a fresh conversation
-        import uuid
-        sender_id = f"user_{uuid.uuid4().hex[:8]}"
-        context['sender_id'] = sender_id
-        logger.info(f"Generated new sender ID for booking: {sender_id}")
     
     payload = {
         "sender": sender_id,
@@ -292,10 +428,10 @@ def send_message():
     }
 
     try:
-        response = requests.post(rasa_url, json=payload, timeout=30)
+        response = rasa_session.post(RASA_WEBHOOK_URL, json=payload, timeout=(CONNECT_TIMEOUT, 30))
         response.raise_for_status()
         data = response.json()
-        logger.info(f"Raw Rasa response: {json.dumps(data, indent=2)}")
+        logger.debug("Raw Rasa response: %s", _LazyJSON(data))
         
         # Update context with last message for fallback filtering
         if message:
@@ -303,20 +439,20 @@ def send_message():
             # Also get current slots from Rasa to check information_sufficient
             sender_id = context.get('sender_id', 'user')
             try:
-                tracker_url = f"{os.environ.get('RASA_URL', DEFAULT_RASA_URL).rstrip('/')}/conversations/{sender_id}/tracker"
-                tracker_response = requests.get(tracker_url, timeout=5)
+                tracker_url = f"{RASA_BASE_URL}/conversations/{sender_id}/tracker"
+                tracker_response = rasa_session.get(tracker_url, params=TRACKER_PARAMS, timeout=(CONNECT_TIMEOUT, 5))
                 if tracker_response.status_code == 200:
                     tracker_data = tracker_response.json()
-                    slots = tracker_data.get('slots', {})
+                    slots = tracker_data.get('slots') or EMPTY_SLOTS
                     if 'slots' not in context:
                         context['slots'] = {}
                     context['slots']['information_sufficient'] = slots.get('information_sufficient')
-                    logger.info(f"Retrieved information_sufficient from tracker: {slots.get('information_sufficient')}")
+                    logger.info("Retrieved information_sufficient from tracker: %s", slots.get('information_sufficient'))
             except Exception as e:
-                logger.warning(f"Could not get tracker state: {e}")
+                logger.warning("Could not get tracker state: %s", e)
         
         processed = process_rasa_response(data, context)
-        logger.info(f"Processed response: {json.dumps(processed, indent=2)}")
+        logger.debug("Processed response: %s", _LazyJSON(processed))
         return jsonify(processed)
     except RequestException as e:
         error_message = f"Error communicating with Rasa server: {str(e)}"
@@ -324,7 +460,7 @@ def send_message():
         return jsonify({
             "error": error_message,
             "context": context,
-            "messages": [{"text": "I'm sorry, I encountered an error processing your request. Please try again later."}]
+            "messages": RASA_ERROR_MESSAGES
         }), 500
     except Exception as e:
         error_message = f"Unexpected error: {str(e)}"
@@ -332,18 +468,129 @@ def send_message():
         return jsonify({
             "error": error_message,
             "context": context,
-            "messages": [{"text": "I apologize, but I encountered an issue processing your request. Please try again."}]
+            "messages": UNEXPECTED_ERROR_MESSAGES
         }), 500
 
 
+def _handle_json_message(json_data, item, result):
+    """Handle the json_message format used by newer Rasa SDKs; it consumes the item."""
+    # Extract action information
+    if json_data.get("action"):
+        action = json_data["action"]
+        result["actions"].append(action)
+    
+        # Handle calendar widget
+        if json_data.get("type") == "calendar":
+            result["messages"].append({
+                "text": json_data.get("message", "Please select your arrival date:"),
+                "json_message": json_data
+            })
+        
+    # Update context with any new information
+    if json_data.get("context"):
+        result["context"].update(json_data["context"])
+        
+    # The rest of this item (custom/image/buttons) is not processed
+    return True
+
+
+def _handle_custom(custom_data, item, result):
+    """Handle the legacy custom format; an undecodable payload consumes the item."""
+    if isinstance(custom_data, str):
+        try:
+            custom_data = json.loads(custom_data)
+        except json.JSONDecodeError:
+            logger.warning("Failed to decode custom JSON: %s", custom_data)
+            return True
+
+        # Handle calendar widget
+        if custom_data.get("type") == "calendar":
+            logger.info("Found calendar widget in custom data: %s", custom_data)
+            # Only add text message if it's not empty and not a duplicate
+            text = item.get("text") or ""
+            stripped = text.strip()
+            if stripped and stripped != custom_data.get("message", ""):
+                result["messages"].append({
+                    "text": text,
+                    "json_message": custom_data
+                })
+            else:
+                # Just add the calendar widget without text (or with empty text)
+                result["messages"].append({
+                    "text": "",
+                    "json_message": custom_data
+                })
+
+    if custom_data.get("action"):
+        result["actions"].append(custom_data["action"])
+        
+    if custom_data.get("context"):
+        result["context"].update(custom_data["context"])
+    return False
+
+
+def _handle_image(url, item, result):
+    """Add an image message."""
+    result["messages"].append({"type": "image", "url": url})
+    return False
+
+
+def _handle_buttons(buttons, item, result):
+    """Attach buttons to the last message (or to a new empty one)."""
+    messages = result["messages"]
+    if messages:
+        messages[-1]["buttons"] = buttons
+    else:
+        messages.append({"text": "", "buttons": buttons})
+    return False
+
+
+# Non-text parts of a Rasa reply item, handled in this order after its text
+ITEM_HANDLERS = (
+    ("json_message", _handle_json_message),
+    ("custom", _handle_custom),
+    ("image", _handle_image),
+    ("buttons", _handle_buttons),
+)
+ITEM_PAYLOAD_KEYS = frozenset(key for key, _handler in ITEM_HANDLERS)
+
+
+def _fallback_filter_state(original_context):
+    """Return (last_message, is_continue, information_sufficient) that decide which fallbacks are hidden."""
+    # CRITICAL: Check if user said "continue" - if so, ALWAYS filter fallback
+    last_message = original_context.get('last_message', '').lower().strip() if original_context.get('last_message') else ''
+    is_continue = bool(CONTINUE_WORD_RE.search(last_message)) if last_message else False
+    # Get information_sufficient from context
+    information_sufficient = (original_context.get('slots') or EMPTY_SLOTS).get('information_sufficient')
+    return last_message, is_continue, information_sufficient
+
+
+def _is_hidden_text(text, text_lower, is_continue, information_sufficient):
+    """Return True (and log why) if a reply text is a Rasa placeholder or a fallback that must not be shown."""
+    # ALWAYS filter "placeholder" messages - these are internal Rasa messages
+    if "placeholder" in text_lower:
+        logger.info("🚫 FILTERING PLACEHOLDER: %s", text)
+        return True
+    if any(phrase in text_lower for phrase in FALLBACK_PHRASES):
+        # ALWAYS filter fallback if user said "continue"
+        if is_continue:
+            logger.info("🚫 ALWAYS FILTERING FALLBACK (user said continue): %s", text)
+            return True
+        # Also filter fallback if information_sufficient == "asked"
+        if information_sufficient == "asked":
+            logger.info("🚫 FILTERING FALLBACK (information_sufficient == asked): %s", text)
+            return True
+    return False
+
+
 def process_rasa_response(response, original_context):
     result = {
         "messages": [],
-        "context": {**original_context},
+        "context": original_context.copy(),
         "actions": []
     }
 
-    logger.info(f"Processing Rasa response: {json.dumps(response, indent=2)}")
+    logger.debug("Processing Rasa response: %s", _LazyJSON(response))
 
     if not response or len(response) == 0:
         # Don't add error message if this is a date confirmation (user already saw the confirmation)
@@ -351,86 +598,74 @@ def process_rasa_response(response, original_context):
         logger.warning("Empty response from Rasa, but this might be expected for date confirmations")
         return result
 
-    # CRITICAL: Check if user said "continue" - if so, ALWAYS filter fallback
-    last_message = original_context.get('last_message', '').lower().strip() if original_context.get('last_message') else ''
-    continue_words = ["continue", "yes", "ok", "okay", "proceed", "go ahead", "let's go", "lets go", "sure", "yeah", "yep", "ja", "jep", "oké", "doorgaan"]
-    # Use word boundaries to match whole words only, not substrings (prevents "book room" from matching "go" in "go ahead")
-    is_continue = any(re.search(r'\b' + re.escape(word) + r'\b', last_message) for word in continue_words) if last_message else False
-    
-    # Get information_sufficient from context
-    information_sufficient = original_context.get('slots', {}).get('information_sufficient') if original_context.get('slots') else None
+    # Plain single-text replies (the usual case): only the placeholder and fallback filters can drop them
+    if isinstance(response, list) and len(response) == 1:
+        item = response[0]
+        text = item.get("text", "")
+        if isinstance(text, str) and ITEM_PAYLOAD_KEYS.isdisjoint(item.keys()):
+            _last_message, is_continue, information_sufficient = _fallback_filter_state(original_context)
+            if text and not _is_hidden_text(text, text.lower(), is_continue, information_sufficient):
+                result["messages"].append({"text": text})
+            return result
+
+    last_message, is_continue, information_sufficient = _fallback_filter_state(original_context)
     
     # Check if response contains the info question
     response_text = ' '.join([item.get("text", "") for item in response if item.get("text")])
     has_info_question = "i hope i've provided you with sufficient information" in response_text.lower()
     
-    logger.info(f"🚨 FALLBACK FILTERING: last_message='{last_message}', is_continue={is_continue}, information_sufficient={information_sufficient}, has_info_question={has_info_question}")
-    
-    # Filter out fallback messages - ALWAYS filter if user said "continue"
-    fallback_phrases = [
-        "i'm sorry i am unable to understand you",
-        "could you please rephrase",
-        "i'm sorry",
-        "unable to understand",
-        "please rephrase",
-        "utter_ask_rephrase"
-    ]
+    logger.info("🚨 FALLBACK FILTERING: last_message='%s', is_continue=%s, information_sufficient=%s, has_info_question=%s", last_message, is_continue, information_sufficient, has_info_question)
     
     # Track seen messages to prevent duplicates
     seen_messages = set()
+    # Whether a guests question has already been added to the result
+    guests_question_sent = False
+    # Booking summary / facility answer / booking question seen among the first markers_scanned kept messages
+    has_booking_summary = has_facility_info = has_booking_question = False
+    markers_scanned = 0
 
     try:
         for item in response:
             text = item.get("text", "")
             if text:
                 text_lower = text.lower()
-                text_normalized = text.strip().lower()
-                
-                # ALWAYS filter "placeholder" messages - these are internal Rasa messages
-                # Check both exact match and if it contains "placeholder"
-                if text_normalized == "placeholder" or "placeholder" in text_normalized:
-                    logger.info(f"🚫 FILTERING PLACEHOLDER: {text}")
-                    continue
+                text_normalized = text_lower.strip()
                 
-                # ALWAYS filter fallback if user said "continue"
-                is_fallback = any(phrase in text_lower for phrase in fallback_phrases)
-                if is_fallback and is_continue:
-                    logger.info(f"🚫 ALWAYS FILTERING FALLBACK (user said continue): {text}")
-                    continue
-                
-                # Also filter fallback if information_sufficient == "asked"
-                if is_fallback and information_sufficient == "asked":
-                    logger.info(f"🚫 FILTERING FALLBACK (information_sufficient == asked): {text}")
+                # Placeholders and hidden fallbacks - shared with the single-text fast path above
+                if _is_hidden_text(text, text_lower, is_continue, information_sufficient):
                     continue
                 
                 # Filter "What else can I help you with?" after booking summaries OR facility questions during booking
                 if "what else can i help" in text_lower or "how can i assist" in text_lower or "how can i help" in text_lower:
+                    # Fold in only the messages kept since the last check instead of re-joining all of them
+                    for msg in result["messages"][markers_scanned:]:
+                        msg_lower = msg.get("text", "").lower()
+                        has_booking_summary = has_booking_summary or "booking reference" in msg_lower or "booking summary" in msg_lower
+                        has_facility_info = has_facility_info or any(indicator in msg_lower for indicator in FACILITY_INDICATORS)
+                        has_booking_question = has_booking_question or any(indicator in msg_lower for indicator in BOOKING_INDICATORS)
+                    markers_scanned = len(result["messages"])
                     # Check if previous messages contain booking summary indicators
-                    previous_messages = ' '.join([msg.get("text", "") for msg in result["messages"]])
-                    if "booking reference" in previous_messages.lower() or "booking summary" in previous_messages.lower():
-                        logger.info(f"🚫 FILTERING 'What else can I help' after booking summary: {text}")
+                    if has_booking_summary:
+                        logger.info("🚫 FILTERING 'What else can I help' after booking summary: %s", text)
                         continue
                     # Also filter if we're in a booking flow (after facility questions like breakfast, pool, etc.)
-                    facility_indicators = ["breakfast", "pool", "parking", "gym", "lunch", "dinner", "is served", "is open", "is available"]
-                    if any(indicator in previous_messages.lower() for indicator in facility_indicators):
-                        # Check if we're in booking flow (guests, room, date, payment questions)
-                        booking_indicators = ["for how many guests", "which room", "arrival", "departure", "payment", "front desk", "online"]
-                        if any(indicator in previous_messages.lower() for indicator in booking_indicators):
-                            logger.info(f"🚫 FILTERING 'What else can I help' after facility question during booking: {text}")
-                            continue
+                    if has_facility_info and has_booking_question:
+                        logger.info("🚫 FILTERING 'What else can I help' after facility question during booking: %s", text)
+                        continue
                 
                 # Filter duplicate messages (exact match)
                 if text_normalized in seen_messages:
-                    logger.info(f"🚫 FILTERING DUPLICATE: {text}")
+                    logger.info("🚫 FILTERING DUPLICATE: %s", text)
                     continue
                 
                 # Check for duplicate "For how many guests?" BEFORE adding to seen_messages
                 # This prevents the first one from being filtered
                 if "for how many guests" in text_lower:
-                    # Check if we already have this message in the result (not just seen_messages)
-                    if any("for how many guests" in msg.get("text", "").lower() for msg in result["messages"]):
-                        logger.info(f"🚫 FILTERING DUPLICATE 'For how many guests?': {text}")
+                    # Catches variants with different wording that the exact-match check misses
+                    if guests_question_sent:
+                        logger.info("🚫 FILTERING DUPLICATE 'For how many guests?': %s", text)
                         continue
+                    guests_question_sent = True
                 
                 # Add to seen_messages AFTER all checks
                 seen_messages.add(text_normalized)
@@ -438,86 +673,35 @@ def process_rasa_response(response, original_context):
             if text:
                 result["messages"].append({"text": text})
             
-            # Check for json_message format which is used by newer Rasa SDK
-            if item.get("json_message"):
-                json_data = item["json_message"]
-                
-                # Extract action information
-                if json_data.get("action"):
-                    action = json_data["action"]
-                    result["actions"].append(action)
-                
-                    # Handle calendar widget
-                    if json_data.get("type") == "calendar":
-                        result["messages"].append({
-                            "text": json_data.get("message", "Please select your arrival date:"),
-                            "json_message": json_data
-                        })
-                    
-                # Update context with any new information
-                if json_data.get("context"):
-                    result["context"].update(json_data["context"])
-                    
-                # Continue processing other parts of the message
+            # Plain text items (the usual case) carry none of the payload keys - skip the dispatch
+            if ITEM_PAYLOAD_KEYS.isdisjoint(item.keys()):
                 continue
-
-            # Handle legacy custom format
-            if item.get("custom"):
-                custom_data = item["custom"]
-                if isinstance(custom_data, str):
-                    try:
-                        custom_data = json.loads(custom_data)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"Failed to decode custom JSON: {custom_data}")
-                        continue
-
-                    # Handle calendar widget
-                    if custom_data.get("type") == "calendar":
-                        logger.info(f"Found calendar widget in custom data: {custom_data}")
-                        # Only add text message if it's not empty and not a duplicate
-                        text = item.get("text", "")
-                        if text and text.strip() and text.strip() != custom_data.get("message", ""):
-                            result["messages"].append({
-                                "text": text,
-                                "json_message": custom_data
-                            })
-                        else:
-                            # Just add the calendar widget without text (or with empty text)
-                            result["messages"].append({
-                                "text": "",
-                                "json_message": custom_data
-                            })
-
-                if custom_data.get("action"):
-                    result["actions"].append(custom_data["action"])
-                    
-                if custom_data.get("context"):
-                    result["context"].update(custom_data["context"])
-
-            if item.get("image"):
-                result["messages"].append({"type": "image", "url": item["image"]})
-
-            if item.get("buttons"):
-                last_message = result["messages"][-1] if result["messages"] else {
-                    "text": ""}
-                last_message["buttons"] = item["buttons"]
-                if not result["messages"] or result["messages"][-1] != last_message:
-                    result["messages"].append(last_message)
+            for key, handler in ITEM_HANDLERS:
+                value = item.get(key)
+                # A handler returning True has consumed the item; later keys are not processed
+                if value and handler(value, item, result):
+                    break
     except Exception as e:
-        logger.error(f"Error processing Rasa response item: {e}", exc_info=True)
+        logger.error("Error processing Rasa response item: %s", e, exc_info=True)
         result["messages"].append({
             "text": "I apologize, but I encountered an issue processing your request. Please try again."
         })
 
-    logger.info(f"Processed result: {json.dumps(result, indent=2)}")
+    logger.debug("Processed result: %s", _LazyJSON(result))
     return result
 
+def _stream_upstream(upstream, chunk_size=8192):
+    """Yield an upstream streamed response body in chunks, releasing its connection when done."""
+    try:
+        yield from upstream.iter_content(chunk_size=chunk_size)
+    finally:
+        upstream.close()
+
 @app.route('/api/text-to-speech', methods=['POST'])
 def text_to_speech():
     """
     Convert text to speech using ElevenLabs API (or fallback to browser TTS).
-    Returns audio data or instructions for browser TTS.
+    Returns an audio/mpeg stream or JSON instructions for browser TTS.
     """
     try:
         data = request.get_json()
@@ -527,8 +711,7 @@ def text_to_speech():
             return jsonify({'error': 'No text provided'}), 400
         
         # Clean text of HTML tags
-        import re
-        clean_text = re.sub(r'<[^>]*>?', '', text)
+        clean_text = HTML_TAG_RE.sub('', text)
         
         # Get ElevenLabs API key from environment variable
         elevenlabs_api_key = os.environ.get('ELEVENLABS_API_KEY')
@@ -554,19 +737,17 @@ def text_to_speech():
                     }
                 }
                 
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = elevenlabs_session.post(url, json=data, headers=headers, timeout=(CONNECT_TIMEOUT, 10), stream=True)
                 
                 if response.status_code == 200:
-                    # Return audio data as base64
-                    import base64
-                    audio_base64 = base64.b64encode(response.content).decode('utf-8')
-                    return jsonify({
-                        'audio': audio_base64,
-                        'format': 'mp3',
-                        'provider': 'elevenlabs'
-                    })
+                    # Pass the MP3 through as it arrives instead of buffering and base64-encoding it
+                    return Response(
+                        _stream_upstream(response),
+                        mimetype='audio/mpeg',
+                        headers={'X-TTS-Provider': 'elevenlabs'}
+                    )
                 else:
-                    logger.warning(f"ElevenLabs API error: {response.status_code} - {response.text}")
+                    logger.warning("ElevenLabs API error: %s - %s", response.status_code, response.text)
                     # Fallback to browser TTS
                     return jsonify({
                         'text': clean_text,
@@ -574,7 +755,7 @@ def text_to_speech():
                         'fallback': True
                     })
             except Exception as e:
-                logger.error(f"ElevenLabs API error: {e}")
+                logger.error("ElevenLabs API error: %s", e)
                 # Fallback to browser TTS
                 return jsonify({
                     'text': clean_text,
@@ -590,7 +771,7 @@ def text_to_speech():
             })
             
     except Exception as e:
-        logger.error(f"Error in text-to-speech: {e}", exc_info=True)
+        logger.error("Error in text-to-speech: %s", e, exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
@@ -599,4 +780,5 @@ if __name__ == '__main__':
     logger.info("To use with Rasa, make sure to start the Rasa server with:")
     logger.info("  - rasa run --enable-api --cors \"*\"")
     logger.info("To use ElevenLabs for natural voices, set ELEVENLABS_API_KEY environment variable")
-    app.run(debug=True, port=port, host='0.0.0.0')
+    # Development server only (gunicorn serves the app in start.sh); set FLASK_DEBUG=1 for the reloader/debugger
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=port, host='0.0.0.0', threaded=True)
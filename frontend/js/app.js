@@ -53,13 +53,15 @@ async function speakText(text) {
             body: JSON.stringify({ text: cleanText })
         });
         
-        const data = await response.json();
+        const contentType = response.headers.get('Content-Type') || '';
         
-        if (data.audio && data.provider === 'elevenlabs') {
-            // Use ElevenLabs audio (natural voice)
-            const audio = new Audio(`data:audio/${data.format};base64,${data.audio}`);
+        if (response.ok && contentType.startsWith('audio/')) {
+            // Use ElevenLabs audio (natural voice), streamed by the server as raw MP3
+            const audioUrl = URL.createObjectURL(await response.blob());
+            const audio = new Audio(audioUrl);
             
             audio.onended = () => {
+                URL.revokeObjectURL(audioUrl);
                 isSpeaking = false;
                 if (speakTextQueue.length > 0) {
                     const nextText = speakTextQueue.shift();
@@ -68,6 +70,7 @@ async function speakText(text) {
             };
             
             audio.onerror = (event) => {
+                URL.revokeObjectURL(audioUrl);
                 console.error('Audio playback error', event);
                 isSpeaking = false;
                 // Fallback to browser TTS
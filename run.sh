@@ -50,9 +50,10 @@ RASA_PID=$!
 # Wait a moment to ensure Rasa server has started
 sleep 10
 
-# Start Flask server in background on port 5000
+# Start Flask server in background on port 5001
 echo "Starting Flask server..."
-python app.py &
+# Threaded gunicorn workers so a slow Rasa reply does not hold up other chats
+gunicorn --workers "${WEB_CONCURRENCY:-2}" --threads 8 --bind "0.0.0.0:${PORT:-5001}" app:app &
 FLASK_PID=$!
 
 echo "Chatbot servers are running!"
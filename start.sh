@@ -6,6 +6,7 @@
 echo "Stopping old servers..."
 pkill -f "rasa run" 2>/dev/null
 pkill -f "python.*app.py" 2>/dev/null
+pkill -f "gunicorn.*app:app" 2>/dev/null
 sleep 2
 
 echo "Activating virtual environment..."
@@ -28,7 +29,8 @@ echo "Waiting for Rasa to start..."
 sleep 8
 
 echo "Starting Flask server..."
-python app.py &
+# Threaded gunicorn workers so a slow Rasa reply does not hold up other chats
+gunicorn --workers "${WEB_CONCURRENCY:-2}" --threads 8 --bind "0.0.0.0:${PORT:-5001}" app:app &
 FLASK_PID=$!
 
 echo ""
@@ -6,5 +6,6 @@
 echo "Stopping servers..."
 pkill -f "rasa run" 2>/dev/null
 pkill -f "python.*app.py" 2>/dev/null
+pkill -f "gunicorn.*app:app" 2>/dev/null
 sleep 1
 echo "Servers stopped"